@@ -0,0 +1,24 @@
+# app/enums.py
+
+from enum import Enum
+
+
+class TransactionType(Enum):
+    """
+    Enum representing types of transactions.
+
+    Lives in its own dependency-light module so that both app.models and
+    app.utility can import it at the top level without a circular import.
+
+    Attributes:
+        EXPENSE: Represents an expense transaction.
+        INCOME: Represents an income transaction.
+    """
+
+    EXPENSE = "expense"
+    INCOME = "income"
+
+
+# Value -> member table so hot paths can turn "income"/"expense" into a
+# TransactionType with a dict lookup instead of the Enum constructor
+TRANSACTION_TYPE_BY_VALUE = {t.value: t for t in TransactionType}
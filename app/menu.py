@@ -1,9 +1,9 @@
 # app/menu.py
 
+import sys
 from abc import ABC, abstractmethod
 from decimal import Decimal
-
-from tabulate import tabulate
+from functools import lru_cache
 
 from app.exception import (
     AlreadyExistsError,
@@ -11,9 +11,11 @@ from app.exception import (
     InvalidInputError,
     NotFoundError,
 )
-from app.models import TransactionType
+from app.models import Account, Transaction, TransactionType
 from app.money_manager import MoneyManager, backup_data
 from app.utility import (
+    buffered_input,
+    format_date,
     read_date,
     read_integer,
     read_positive_float,
@@ -21,36 +23,70 @@ from app.utility import (
 )
 
 
+@lru_cache(maxsize=64)
 def format_header(key: str) -> str:
     """Convert dictionary key to properly formatted header (Title Case with spaces)."""
     return key.replace("_", " ").title()
 
 
+@lru_cache(maxsize=16)
+def _headers_for(keys: tuple) -> list[str]:
+    """Return the formatted header list for a key tuple (cached per key set)."""
+    return [format_header(k) for k in keys]
+
+
+def print_rows(headers: list[str], rows) -> None:
+    """
+    Print rows as a formatted table under the given headers.
+
+    Accepts any iterable of rows (list or generator); only the stringified
+    cells are materialized, so callers can pipe rows straight from their
+    source without building an intermediate list of tuples.
+    """
+    # Stringify every cell once up front (also consumes a generator input)
+    rows = [[str(cell) for cell in row] for row in rows]
+
+    if not rows:
+        print("(No data)")
+        return
+
+    # Column width = widest cell in each column (header included)
+    widths = [
+        max(len(header), max(len(row[i]) for row in rows))
+        for i, header in enumerate(headers)
+    ]
+
+    # Build all lines first and emit them with a single write
+    lines = ["  ".join(h.ljust(w) for h, w in zip(headers, widths))]
+    lines.append("  ".join("-" * w for w in widths))
+    for row in rows:
+        lines.append("  ".join(cell.ljust(w) for cell, w in zip(row, widths)))
+
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
 def print_table(data: list[dict]) -> None:
     """Print data as a formatted table with proper headers."""
     if not data:
         print("(No data)")
         return
 
-    # Get column keys and format them as headers
+    # Get column keys and format them as headers (cached per key set)
     keys = list(data[0].keys())
-    headers = [format_header(k) for k in keys]
-
-    # Convert list of dicts to list of lists (rows)
-    rows = [[record[k] for k in keys] for record in data]
+    headers = _headers_for(tuple(keys))
 
-    print(tabulate(rows, headers=headers))
+    print_rows(headers, ([record[k] for k in keys] for record in data))
 
 
 def add_transaction(money_manager: MoneyManager):
     """Add a new transaction."""
 
     # Collect input data from user
-    transaction_type_input = input("Transaction type (Income/Expense): ")
-    category = input("Category: ")
-    account_name = input("Account: ")
-    amount = input("Amount: ")
-    description = input("Description: ")
+    transaction_type_input = buffered_input("Transaction type (Income/Expense): ")
+    category = buffered_input("Category: ")
+    account_name = buffered_input("Account: ")
+    amount = buffered_input("Amount: ")
+    description = buffered_input("Description: ")
 
     try:
         # Call the backend function
@@ -69,8 +105,7 @@ def add_transaction(money_manager: MoneyManager):
 def view_all_transactions(money_manager: MoneyManager):
     """View all transactions."""
     transactions = money_manager.transaction_service.get_all_transactions()
-    transactions = [t.to_dict() for t in transactions]
-    print_table(transactions)
+    print_rows(_headers_for(Transaction.FIELDS), (t.to_row() for t in transactions))
 
 
 def edit_transaction(money_manager: MoneyManager):
@@ -86,19 +121,19 @@ def edit_transaction(money_manager: MoneyManager):
     print("Leave field blank to keep current value.")
 
     print(f"Current Type: {transaction.transaction_type.value}")
-    new_type = input("New Type (Income/Expense): ") or ""
+    new_type = buffered_input("New Type (Income/Expense): ") or ""
 
     print(f"Current Category: {transaction.category}")
-    new_category = input("New Category: ") or ""
+    new_category = buffered_input("New Category: ") or ""
 
     print(f"Current Account: {transaction.account.account_name}")
-    new_account_name = input("New Account: ") or ""
+    new_account_name = buffered_input("New Account: ") or ""
 
     print(f"Current Amount: {transaction.amount}")
-    new_amount = input("New Amount: ") or ""
+    new_amount = buffered_input("New Amount: ") or ""
 
     print(f"Current Description: {transaction.description}")
-    new_description = input("New Description: ") or ""
+    new_description = buffered_input("New Description: ") or ""
 
     try:
         money_manager.transaction_service.edit_transaction(
@@ -127,7 +162,7 @@ def delete_transaction(money_manager: MoneyManager):
 
 def add_account(money_manager: MoneyManager):
     """Add a new account."""
-    account_name = input("Account name: ")
+    account_name = buffered_input("Account name: ")
     initial_balance = str(read_positive_float("Initial balance: "))
 
     try:
@@ -142,14 +177,13 @@ def add_account(money_manager: MoneyManager):
 def view_all_accounts(money_manager: MoneyManager):
     """View all accounts."""
     accounts = money_manager.account_service.get_all_accounts()
-    data = [a.to_dict() for a in accounts]
-    print_table(data)
+    print_rows(_headers_for(Account.FIELDS), (a.to_row() for a in accounts))
 
 
 def edit_account_name(money_manager: MoneyManager):
     """Rename an existing account."""
-    old_name = input("Current account name: ")
-    new_name = input("New account name: ")
+    old_name = buffered_input("Current account name: ")
+    new_name = buffered_input("New account name: ")
 
     try:
         updated = money_manager.account_service.edit_account_name(old_name, new_name)
@@ -160,7 +194,7 @@ def edit_account_name(money_manager: MoneyManager):
 
 def delete_account(money_manager: MoneyManager):
     """Delete an account."""
-    account_name = input("Account name to delete: ")
+    account_name = buffered_input("Account name to delete: ")
     try:
         money_manager.account_service.delete_account(account_name)
         print(f"Account '{account_name}' deleted successfully")
@@ -170,8 +204,8 @@ def delete_account(money_manager: MoneyManager):
 
 def add_category(money_manager: MoneyManager):
     """Add a new category."""
-    transaction_type_category = input("Type (Income/Expense): ")
-    category = input("New Category: ")
+    transaction_type_category = buffered_input("Type (Income/Expense): ")
+    category = buffered_input("New Category: ")
 
     try:
         money_manager.category_service.add_category(category, transaction_type_category)
@@ -200,9 +234,9 @@ def view_all_categories(money_manager: MoneyManager):
 
 def edit_category(money_manager: MoneyManager):
     """Edit a category name."""
-    transaction_type_category = input("Type (Income/Expense): ")
-    old_category_name = input("Old category name: ")
-    new_category_name = input("New category name: ")
+    transaction_type_category = buffered_input("Type (Income/Expense): ")
+    old_category_name = buffered_input("Old category name: ")
+    new_category_name = buffered_input("New category name: ")
 
     try:
         money_manager.category_service.edit_category(
@@ -217,8 +251,8 @@ def edit_category(money_manager: MoneyManager):
 
 def delete_category(money_manager: MoneyManager):
     """Delete a category."""
-    transaction_type_category = input("Type (Income/Expense): ")
-    category_name = input("Category name: ")
+    transaction_type_category = buffered_input("Type (Income/Expense): ")
+    category_name = buffered_input("Category name: ")
 
     try:
         money_manager.category_service.delete_category(
@@ -231,7 +265,7 @@ def delete_category(money_manager: MoneyManager):
 
 def filter_by_category(money_manager: MoneyManager):
     """Filter transactions by category."""
-    category = input("Enter category name: ")
+    category = buffered_input("Enter category name: ")
 
     try:
         result = money_manager.filter_service.filter_transaction_by_category(category)
@@ -239,15 +273,16 @@ def filter_by_category(money_manager: MoneyManager):
         if not result:
             print("No result found!")
         else:
-            data = [r.to_dict() for r in result]
-            print_table(data)
+            print_rows(
+                _headers_for(Transaction.FIELDS), (r.to_row() for r in result)
+            )
     except (InvalidInputError, NotFoundError) as e:
         print(f"Error: {e}")
 
 
 def filter_by_account(money_manager: MoneyManager):
     """Filter transactions by account."""
-    account_name = input("Account name: ")
+    account_name = buffered_input("Account name: ")
 
     try:
         result = money_manager.filter_service.filter_transaction_by_account(
@@ -257,15 +292,16 @@ def filter_by_account(money_manager: MoneyManager):
         if not result:
             print("No result found!")
         else:
-            data = [r.to_dict() for r in result]
-            print_table(data)
+            print_rows(
+                _headers_for(Transaction.FIELDS), (r.to_row() for r in result)
+            )
     except (InvalidInputError, NotFoundError) as e:
         print(f"Error: {e}")
 
 
 def filter_by_transaction_type(money_manager: MoneyManager):
     """Filter transactions by transaction type."""
-    transaction_type = input("Transaction type (Income/Expense): ")
+    transaction_type = buffered_input("Transaction type (Income/Expense): ")
 
     try:
         result = money_manager.filter_service.filter_transaction_by_transaction_type(
@@ -275,8 +311,9 @@ def filter_by_transaction_type(money_manager: MoneyManager):
         if not result:
             print("No result found!")
         else:
-            data = [r.to_dict() for r in result]
-            print_table(data)
+            print_rows(
+                _headers_for(Transaction.FIELDS), (r.to_row() for r in result)
+            )
     except InvalidInputError as e:
         print(f"Error: {e}")
 
@@ -313,74 +350,76 @@ def monthly_summary(money_manager: MoneyManager):
         print(f"Error: {e}")
 
 
-def expenses_summary(money_manager: MoneyManager):
-    """Show expenses summary by category for a date range."""
+def _category_summary(money_manager: MoneyManager, transaction_type: TransactionType):
+    """
+    Show a per-category summary report for a date range.
+
+    Shared body for expenses_summary/income_summary: collects the date range,
+    fetches the per-category totals, then builds the whole report into a list
+    of lines and emits it with a single sys.stdout.write instead of one
+    print() per line.
+
+    Args:
+        money_manager (MoneyManager): Money manager holding the summary service.
+        transaction_type (TransactionType): Which side to report (INCOME or EXPENSE).
+    """
     try:
         start_date = read_date("Enter start date: ")
         end_date = read_date("Enter end date:")
 
-        expenses_by_category = money_manager.summary_service.get_expenses_by_category(
-            start_date, end_date
-        )
-        total_expense = sum(expenses_by_category.values(), Decimal("0.00"))
-
-        if not expenses_by_category or total_expense == Decimal("0.00"):
-            print("No expenses found in this period.")
+        if transaction_type is TransactionType.EXPENSE:
+            by_category, total = money_manager.summary_service.get_expenses_by_category(
+                start_date, end_date
+            )
+            kind, empty_msg, total_label = (
+                "Expenses",
+                "No expenses found in this period.",
+                "TOTAL EXPENSES",
+            )
         else:
-            print(
-                f"\nExpenses from {start_date.strftime('%d-%m-%Y')} to {end_date.strftime('%d-%m-%Y')}"
+            by_category, total = money_manager.summary_service.get_income_by_category(
+                start_date, end_date
+            )
+            kind, empty_msg, total_label = (
+                "Incomes",
+                "No incomes found in this period.",
+                "TOTAL INCOME",
             )
-            print("=" * 60)
-            print("\nBreakdown by Category:")
-            print("-" * 60)
 
-            sorted_expenses = sorted(
-                expenses_by_category.items(), key=lambda x: x[1], reverse=True
+        if not by_category or total == Decimal("0.00"):
+            print(empty_msg)
+        else:
+            parts = [
+                f"\n{kind} from {format_date(start_date)} to {format_date(end_date)}",
+                "=" * 60,
+                "\nBreakdown by Category:",
+                "-" * 60,
+            ]
+
+            sorted_totals = sorted(
+                by_category.items(), key=lambda x: x[1], reverse=True
             )
 
-            for category, amount in sorted_expenses:
-                print(f"  {category:30s} ${amount:>12}")
+            for category, amount in sorted_totals:
+                parts.append(f"  {category:30s} ${amount:>12}")
+
+            parts.append("-" * 60)
+            parts.append(f"  {total_label:30s} ${total:>12}")
+            parts.append("=" * 60)
 
-            print("-" * 60)
-            print(f"  {'TOTAL EXPENSES':30s} ${total_expense:>12}")
-            print("=" * 60)
+            sys.stdout.write("\n".join(parts) + "\n")
     except InvalidInputError as e:
         print(f"Error: {e}")
 
 
-def income_summary(money_manager: MoneyManager):
-    """Show income summary by category for a date range."""
-    try:
-        start_date = read_date("Enter start date: ")
-        end_date = read_date("Enter end date:")
-
-        income_by_category = money_manager.summary_service.get_income_by_category(
-            start_date, end_date
-        )
-        total_income = sum(income_by_category.values(), Decimal("0.00"))
-
-        if not income_by_category or total_income == Decimal("0.00"):
-            print("No incomes found in this period.")
-        else:
-            print(
-                f"\nIncomes from {start_date.strftime('%d-%m-%Y')} to {end_date.strftime('%d-%m-%Y')}"
-            )
-            print("=" * 60)
-            print("\nBreakdown by Category:")
-            print("-" * 60)
-
-            sorted_incomes = sorted(
-                income_by_category.items(), key=lambda x: x[1], reverse=True
-            )
+def expenses_summary(money_manager: MoneyManager):
+    """Show expenses summary by category for a date range."""
+    _category_summary(money_manager, TransactionType.EXPENSE)
 
-            for category, amount in sorted_incomes:
-                print(f"  {category:30s} ${amount:>12}")
 
-            print("-" * 60)
-            print(f"  {'TOTAL INCOME':30s} ${total_income:>12}")
-            print("=" * 60)
-    except InvalidInputError as e:
-        print(f"Error: {e}")
+def income_summary(money_manager: MoneyManager):
+    """Show income summary by category for a date range."""
+    _category_summary(money_manager, TransactionType.INCOME)
 
 
 def backup_data_action(money_manager: MoneyManager):
@@ -428,6 +467,15 @@ class QuitAction(UserAction):
 
 
 class AccountOperation(UserAction):
+    # Dispatch table: option number -> handler
+    HANDLERS = {
+        1: add_account,
+        2: view_all_accounts,
+        3: edit_account_name,
+        4: delete_account,
+    }
+    BACK_OPTION = 5
+
     def show_option(self) -> str:
         return "Account Operation"
 
@@ -443,21 +491,26 @@ class AccountOperation(UserAction):
             choice = read_integer("Select an option: ")
             print()
 
-            if choice == 1:
-                add_account(money_manager)
-            elif choice == 2:
-                view_all_accounts(money_manager)
-            elif choice == 3:
-                edit_account_name(money_manager)
-            elif choice == 4:
-                delete_account(money_manager)
-            elif choice == 5:
+            if choice == self.BACK_OPTION:
                 break
+
+            handler = self.HANDLERS.get(choice)
+            if handler:
+                handler(money_manager)
             else:
                 print("Invalid option. Try again.")
 
 
 class CategoryOperation(UserAction):
+    # Dispatch table: option number -> handler
+    HANDLERS = {
+        1: add_category,
+        2: view_all_categories,
+        3: edit_category,
+        4: delete_category,
+    }
+    BACK_OPTION = 5
+
     def show_option(self) -> str:
         return "Category Operation"
 
@@ -473,21 +526,26 @@ class CategoryOperation(UserAction):
             choice = read_integer("Select an option: ")
             print()
 
-            if choice == 1:
-                add_category(money_manager)
-            elif choice == 2:
-                view_all_categories(money_manager)
-            elif choice == 3:
-                edit_category(money_manager)
-            elif choice == 4:
-                delete_category(money_manager)
-            elif choice == 5:
+            if choice == self.BACK_OPTION:
                 break
+
+            handler = self.HANDLERS.get(choice)
+            if handler:
+                handler(money_manager)
             else:
                 print("Invalid option. Try again.")
 
 
 class TransactionOperation(UserAction):
+    # Dispatch table: option number -> handler
+    HANDLERS = {
+        1: add_transaction,
+        2: view_all_transactions,
+        3: edit_transaction,
+        4: delete_transaction,
+    }
+    BACK_OPTION = 5
+
     def show_option(self) -> str:
         return "Transaction Operation"
 
@@ -503,21 +561,25 @@ class TransactionOperation(UserAction):
             choice = read_integer("Select an option: ")
             print()
 
-            if choice == 1:
-                add_transaction(money_manager)
-            elif choice == 2:
-                view_all_transactions(money_manager)
-            elif choice == 3:
-                edit_transaction(money_manager)
-            elif choice == 4:
-                delete_transaction(money_manager)
-            elif choice == 5:
+            if choice == self.BACK_OPTION:
                 break
+
+            handler = self.HANDLERS.get(choice)
+            if handler:
+                handler(money_manager)
             else:
                 print("Invalid option. Try again.")
 
 
 class FilterTransactionAction(UserAction):
+    # Dispatch table: option number -> handler
+    HANDLERS = {
+        1: filter_by_category,
+        2: filter_by_account,
+        3: filter_by_transaction_type,
+    }
+    BACK_OPTION = 4
+
     def show_option(self) -> str:
         return "Filter Transaction"
 
@@ -532,19 +594,27 @@ class FilterTransactionAction(UserAction):
             option = read_integer("Select an option: ")
             print()
 
-            if option == 1:
-                filter_by_category(money_manager)
-            elif option == 2:
-                filter_by_account(money_manager)
-            elif option == 3:
-                filter_by_transaction_type(money_manager)
-            elif option == 4:
+            if option == self.BACK_OPTION:
                 break
+
+            handler = self.HANDLERS.get(option)
+            if handler:
+                handler(money_manager)
             else:
                 print("Invalid option. Try again.")
 
 
 class ShowSummaryAction(UserAction):
+    # Dispatch table: option number -> handler
+    HANDLERS = {
+        1: daily_summary,
+        2: weekly_summary,
+        3: monthly_summary,
+        4: expenses_summary,
+        5: income_summary,
+    }
+    BACK_OPTION = 6
+
     def show_option(self) -> str:
         return "View Summary"
 
@@ -561,18 +631,12 @@ class ShowSummaryAction(UserAction):
             option = read_integer("Select an option: ")
             print()
 
-            if option == 1:
-                daily_summary(money_manager)
-            elif option == 2:
-                weekly_summary(money_manager)
-            elif option == 3:
-                monthly_summary(money_manager)
-            elif option == 4:
-                expenses_summary(money_manager)
-            elif option == 5:
-                income_summary(money_manager)
-            elif option == 6:
+            if option == self.BACK_OPTION:
                 break
+
+            handler = self.HANDLERS.get(option)
+            if handler:
+                handler(money_manager)
             else:
                 print("Invalid option. Try again.")
 
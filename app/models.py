@@ -2,22 +2,21 @@
 
 from datetime import datetime
 from decimal import Decimal
-from enum import Enum
 
-from app.utility import format_amount, format_datetime
+# Re-exported here so existing `from app.models import TransactionType`
+# imports keep working; the enum itself lives in the dependency-light
+# app.enums module
+from app.enums import TRANSACTION_TYPE_BY_VALUE, TransactionType
+from app.utility import format_datetime, from_cents, parse_datetime, to_cents
 
+# Signed multiplier per transaction type: income adds to a balance,
+# expense subtracts. Lets balance updates be a single multiply-add
+# instead of an if/elif cascade.
+_TYPE_SIGN = {TransactionType.INCOME: 1, TransactionType.EXPENSE: -1}
 
-class TransactionType(Enum):
-    """
-    Enum representing types of transactions.
-
-    Attributes:
-        EXPENSE: Represents an expense transaction.
-        INCOME: Represents an income transaction.
-    """
-
-    EXPENSE = "expense"
-    INCOME = "income"
+# Sort-key stand-in for a transaction that somehow has no timestamp
+# (partial import, interrupted edit): sorting must never raise
+_DATETIME_MIN = datetime.min
 
 
 class Account:
@@ -26,10 +25,15 @@ class Account:
 
     Attributes:
         account_name (str): Name of the account.
-        _balance (Decimal): Current balance of the account (private).
+        _balance_cents (int): Current balance of the account in cents (private).
         transactions (list[Transaction]): List of transactions linked to the account.
     """
 
+    __slots__ = ("account_name", "_balance_cents", "transactions", "_dict_cache")
+
+    # Field names matching the to_row() column order, for table headers
+    FIELDS = ("account_name", "balance")
+
     def __init__(self, account_name: str, balance: str) -> None:
         """
         Initialize an Account instance.
@@ -40,13 +44,18 @@ class Account:
         """
 
         self.account_name = account_name
-        self._balance = format_amount(balance)
+        # Balance is held as integer cents so updates are plain int math;
+        # the public `balance` property converts back to Decimal
+        self._balance_cents = to_cents(balance)
         self.transactions: list["Transaction"] = []
 
+        # Cached to_dict() result, invalidated whenever the account mutates
+        self._dict_cache: dict | None = None
+
     @property
     def balance(self) -> Decimal:
         """Return the current balance of the account."""
-        return self._balance
+        return from_cents(self._balance_cents)
 
     def add_transaction(self, transaction: "Transaction") -> None:
         """Add a transaction to the account's transaction list."""
@@ -67,10 +76,10 @@ class Account:
             transaction_type (TransactionType): Type of transaction (INCOME or EXPENSE).
         """
 
-        if transaction_type == TransactionType.INCOME:
-            self._balance += amount
-        elif transaction_type == TransactionType.EXPENSE:
-            self._balance -= amount
+        self._balance_cents += _TYPE_SIGN[transaction_type] * int(amount.scaleb(2))
+
+        # Balance changed, so the cached dict is stale
+        self._dict_cache = None
 
     def reverse_balance(
         self, amount: Decimal, transaction_type: TransactionType
@@ -84,14 +93,23 @@ class Account:
             transaction_type (TransactionType): Type of transaction (INCOME or EXPENSE).
         """
 
-        if transaction_type == TransactionType.INCOME:
-            self._balance -= amount
-        elif transaction_type == TransactionType.EXPENSE:
-            self._balance += amount
+        self._balance_cents -= _TYPE_SIGN[transaction_type] * int(amount.scaleb(2))
+
+        # Balance changed, so the cached dict is stale
+        self._dict_cache = None
 
     def to_dict(self) -> dict:
-        """Return a dictionary representation of the account."""
-        return {"account_name": self.account_name, "balance": str(self._balance)}
+        """Return a dictionary representation of the account (cached until mutated)."""
+        if self._dict_cache is None:
+            self._dict_cache = {
+                "account_name": self.account_name,
+                "balance": str(self.balance),
+            }
+        return self._dict_cache
+
+    def to_row(self) -> tuple:
+        """Return the account as a plain tuple of cells for table rendering."""
+        return (self.account_name, str(self.balance))
 
 
 class Transaction:
@@ -105,13 +123,37 @@ class Transaction:
         category (str): Category of the transaction
         account (Account): Account associated with the transaction.
         amount (Decimal): Transaction amount.
+        amount_cents (int): Transaction amount in integer cents.
         description (str): Optional description of the transaction.
     """
 
+    __slots__ = (
+        "transaction_id",
+        "_datetime",
+        "_datetime_raw",
+        "transaction_type",
+        "category",
+        "account",
+        "_amount_cents",
+        "description",
+        "_dict_cache",
+    )
+
+    # Field names matching the to_row() column order, for table headers
+    FIELDS = (
+        "transaction_id",
+        "datetime",
+        "transaction_type",
+        "category",
+        "account",
+        "amount",
+        "description",
+    )
+
     def __init__(
         self,
         transaction_id: int,
-        datetime: datetime,
+        datetime: datetime | str,
         transaction_type: TransactionType,
         category: str,
         account: Account,
@@ -123,7 +165,8 @@ class Transaction:
 
         Args:
             transaction_id (int): ID for the transaction.
-            datetime (datetime): Date and time of the transaction.
+            datetime (datetime | str): Date and time of the transaction. A raw
+                saved string is kept as-is and parsed lazily on first access.
             transaction_type (TransactionType): Type of transaction.
             category (str): Category of the transaction.
             account (Account): Account linked to this transaction.
@@ -132,26 +175,93 @@ class Transaction:
         """
 
         self.transaction_id = transaction_id
-        self.datetime = datetime
+        if isinstance(datetime, str):
+            # Raw saved string; parsing is deferred until something needs
+            # the datetime object
+            self._datetime = None
+            self._datetime_raw = datetime
+        else:
+            self._datetime = datetime
+            self._datetime_raw = None
         self.transaction_type = transaction_type
         self.category = category
         self.account = account
-        self.amount = format_amount(amount)
+        self.amount = amount
         self.description = description
 
+        # Cached to_dict() result, invalidated whenever the transaction mutates
+        self._dict_cache: dict | None = None
+
+    @property
+    def datetime(self) -> datetime:
+        """Date and time of the transaction, parsed lazily when loaded from disk."""
+        if self._datetime is None:
+            raw = self._datetime_raw
+            # An un-timestamped row sorts first instead of blowing up the
+            # chronological views
+            self._datetime = parse_datetime(raw) if raw is not None else _DATETIME_MIN
+        return self._datetime
+
+    @datetime.setter
+    def datetime(self, value: datetime) -> None:
+        self._datetime = value
+        self._datetime_raw = None
+        self._dict_cache = None
+
+    @property
+    def amount(self) -> Decimal:
+        """Transaction amount as a two-decimal Decimal."""
+        return from_cents(self._amount_cents)
+
+    @amount.setter
+    def amount(self, value) -> None:
+        # Amount is held as integer cents so summations stay plain int
+        # math; rounding matches format_amount via to_cents
+        self._amount_cents = to_cents(value)
+        self._dict_cache = None
+
+    @property
+    def amount_cents(self) -> int:
+        """Transaction amount in integer cents, for hot summation loops."""
+        return self._amount_cents
+
+    def _datetime_str(self) -> str:
+        """Return the formatted datetime, reusing the raw string when unparsed."""
+        if self._datetime is None:
+            return self._datetime_raw
+        return format_datetime(self._datetime)
+
     def to_dict(self):
         """
         Return a dictionary representation of the transaction.
 
+        The dictionary is cached on first call and reused until the transaction
+        is mutated (edit/rename), so repeated views and saves avoid re-running
+        datetime formatting and dict construction.
+
         Returns:
             dict: Dictionary containing transaction details.
         """
-        return {
-            "transaction_id": self.transaction_id,
-            "datetime": format_datetime(self.datetime),
-            "transaction_type": self.transaction_type.value,
-            "category": self.category,
-            "account": self.account.account_name,
-            "amount": str(self.amount),
-            "description": self.description,
-        }
+        if self._dict_cache is None:
+            self._dict_cache = {
+                "transaction_id": self.transaction_id,
+                "datetime": self._datetime_str(),
+                "transaction_type": self.transaction_type.value,
+                "category": self.category,
+                "account": self.account.account_name,
+                "amount": str(self.amount),
+                "description": self.description,
+            }
+        return self._dict_cache
+
+    def to_row(self) -> tuple:
+        """Return the transaction as a plain tuple of cells for table rendering."""
+        return (
+            self.transaction_id,
+            self._datetime_str(),
+            self.transaction_type.value,
+            self.category,
+            self.account.account_name,
+            str(self.amount),
+            self.description,
+        )
@@ -1,17 +1,28 @@
 # app/money_manager.py
 
 import datetime
+import filecmp
 import json
 import os
 import shutil
+from contextlib import contextmanager
 
-from app.models import Account, Transaction, TransactionType
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+from app.models import TRANSACTION_TYPE_BY_VALUE, Account, Transaction
 from app.services.account_service import AccountService
 from app.services.category_service import CategoryService
 from app.services.filter_service import FilterService
 from app.services.summary_service import SummaryService
 from app.services.transaction_service import TransactionService
-from app.utility import parse_datetime
 
 
 class MoneyManager:
@@ -21,8 +32,8 @@ class MoneyManager:
     Attributes:
         accounts (dict[str, Account]): Dictionary of accounts keyed by name.
         transactions (list[Transaction]): List of all transactions.
-        income_categories (list[str]): List of income categories.
-        expense_categories (list[str]): List of expense categories.
+        income_categories (dict[str, None]): Income categories in insertion order.
+        expense_categories (dict[str, None]): Expense categories in insertion order.
         account_service (AccountService): Service to manage accounts.
         transaction_service (TransactionService): Service to manage transactions.
         category_service (CategoryService): Service to manage categories.
@@ -44,23 +55,38 @@ class MoneyManager:
         self.accounts: dict[str, Account] = {}
         self.transactions: list[Transaction] = []
 
-        # Default income and expense categories
-        self.income_categories = [
-            "Salary",
-            "Business",
-            "Investment",
-            "Gift",
-            "Other Income",
-        ]
-        self.expense_categories = [
-            "Food",
-            "Transport",
-            "Entertainment",
-            "Bills",
-            "Shopping",
-            "Healthcare",
-            "Other Expense",
-        ]
+        # Bumped on every transaction mutation; lets caches keyed on the
+        # version invalidate in O(1)
+        self.txn_version: int = 0
+
+        # Batch-save state: inside a batch() block, save() only marks the
+        # data dirty and the file is written once when the outermost
+        # batch exits. The depth counter makes nesting safe.
+        self._save_depth: int = 0
+        self._dirty: bool = False
+
+        # Default income and expense categories, stored as insertion-ordered
+        # dicts so membership, insert, and delete are all O(1)
+        self.income_categories: dict[str, None] = dict.fromkeys(
+            (
+                "Salary",
+                "Business",
+                "Investment",
+                "Gift",
+                "Other Income",
+            )
+        )
+        self.expense_categories: dict[str, None] = dict.fromkeys(
+            (
+                "Food",
+                "Transport",
+                "Entertainment",
+                "Bills",
+                "Shopping",
+                "Healthcare",
+                "Other Expense",
+            )
+        )
 
         # Load data from file if it exists
         self._load_data()
@@ -72,45 +98,87 @@ class MoneyManager:
         self.filter_service = FilterService(money_manager=self)
         self.summary_service = SummaryService(money_manager=self)
 
+    def _load_accounts(self, records) -> None:
+        """Construct and register Accounts from an iterable of saved dicts."""
+
+        # Bind hot names to locals: LOAD_FAST beats attribute/global
+        # lookups inside the per-record loop
+        accounts = self.accounts
+        _account = Account
+
+        for acc_data in records:
+            account = _account(
+                account_name=acc_data["account_name"], balance=acc_data["balance"]
+            )
+            accounts[account.account_name] = account
+
+    def _load_transactions(self, records) -> None:
+        """Construct Transactions from an iterable of saved dicts and link them to their accounts."""
+
+        # Bind hot names to locals: LOAD_FAST beats attribute/global
+        # lookups inside the per-record loop
+        accounts = self.accounts
+        transactions = self.transactions
+        _transaction = Transaction
+        _type_by_value = TRANSACTION_TYPE_BY_VALUE
+
+        for trans_data in records:
+            account = accounts[trans_data["account"]]
+
+            # The raw datetime string is handed over as-is; Transaction
+            # parses it lazily on first access
+            transaction = _transaction(
+                transaction_id=trans_data["transaction_id"],
+                datetime=trans_data["datetime"],
+                transaction_type=_type_by_value[trans_data["transaction_type"]],
+                category=trans_data["category"],
+                account=account,
+                amount=trans_data["amount"],
+                description=trans_data["description"],
+            )
+
+            transactions.append(transaction)
+            account.add_transaction(transaction)
+
     def _load_data(self):
         """Load accounts, transactions, and categories from the JSON data file."""
 
         try:
-            with open(self._data_path, "r") as f:
-                data = json.load(f)
+            if ijson is not None:
+                # Stream each section straight from disk so the whole JSON
+                # tree is never materialized at once
+                with open(self._data_path, "rb") as f:
+                    self._load_accounts(ijson.items(f, "accounts.item"))
 
-            # Load accounts
-            for acc_data in data.get("accounts", []):
-                account = Account(
-                    account_name=acc_data["account_name"], balance=acc_data["balance"]
-                )
-                self.accounts[account.account_name] = account
-
-            # Load transactions and associate them with accounts
-            for trans_data in data.get("transactions", []):
-                account_name = trans_data["account"]
-                account = self.accounts[account_name]
-
-                transaction = Transaction(
-                    transaction_id=trans_data["transaction_id"],
-                    datetime=parse_datetime(trans_data["datetime"]),
-                    transaction_type=TransactionType(trans_data["transaction_type"]),
-                    category=trans_data["category"],
-                    account=account,
-                    amount=trans_data["amount"],
-                    description=trans_data["description"],
-                )
+                with open(self._data_path, "rb") as f:
+                    self._load_transactions(ijson.items(f, "transactions.item"))
 
-                self.transactions.append(transaction)
-                account.add_transaction(transaction)
+                # Category lists are tiny; yield each list whole so absent
+                # keys keep the defaults
+                with open(self._data_path, "rb") as f:
+                    for categories in ijson.items(f, "income_categories"):
+                        self.income_categories = dict.fromkeys(categories)
 
-            # Load categories if saved, otherwise keep defaults
-            self.income_categories = data.get(
-                "income_categories", self.income_categories
-            )
-            self.expense_categories = data.get(
-                "expense_categories", self.expense_categories
-            )
+                with open(self._data_path, "rb") as f:
+                    for categories in ijson.items(f, "expense_categories"):
+                        self.expense_categories = dict.fromkeys(categories)
+            else:
+                with open(self._data_path, "r") as f:
+                    data = json.load(f)
+
+                # Load accounts
+                self._load_accounts(data.get("accounts", []))
+
+                # Load transactions and associate them with accounts
+                self._load_transactions(data.get("transactions", []))
+
+                # Load categories if saved, otherwise keep defaults
+                self.income_categories = dict.fromkeys(
+                    data.get("income_categories", self.income_categories)
+                )
+                self.expense_categories = dict.fromkeys(
+                    data.get("expense_categories", self.expense_categories)
+                )
 
         except FileNotFoundError:
             # If file does not exist, initialize empty and default data
@@ -121,22 +189,91 @@ class MoneyManager:
         data_to_save = {
             "accounts": [a.to_dict() for a in self.accounts.values()],
             "transactions": [t.to_dict() for t in self.transactions],
-            "income_categories": self.income_categories,
-            "expense_categories": self.expense_categories,
+            "income_categories": list(self.income_categories),
+            "expense_categories": list(self.expense_categories),
         }
 
-        with open(self._data_path, "w") as f:
-            json.dump(data_to_save, f, indent=4)
+        # Serialize with orjson (C-implemented) when available, otherwise
+        # stdlib json without indent, and write the whole buffer in one
+        # os.write call to skip Python's text-mode buffering
+        if orjson is not None:
+            buf = orjson.dumps(data_to_save, option=orjson.OPT_INDENT_2)
+        else:
+            buf = json.dumps(data_to_save).encode("utf-8")
+
+        fd = os.open(self._data_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, buf)
+        finally:
+            os.close(fd)
 
     def save(self):
-        """Public method to save all data."""
+        """Public method to save all data (deferred to batch exit inside batch())."""
+        if self._save_depth:
+            self._dirty = True
+            return
         self._save_data()
 
+    @contextmanager
+    def batch(self):
+        """
+        Coalesce save() calls within the block into a single file write.
+
+        Mutating several things in a row serializes and rewrites the data
+        file once per mutation; wrapping the calls in `with manager.batch():`
+        defers the write to the end of the block, and skips it entirely if
+        nothing was saved. Batches nest: only the outermost exit writes.
+
+        Yields:
+            MoneyManager: This manager, for convenience.
+        """
+        self._save_depth += 1
+        try:
+            yield self
+        finally:
+            self._save_depth -= 1
+            if not self._save_depth and self._dirty:
+                self._dirty = False
+                self._save_data()
+
+
+def _latest_backup(backup_dir: str) -> str | None:
+    """Return the path of the most recent backup file, or None if there is none."""
+    try:
+        backups = [
+            os.path.join(backup_dir, name)
+            for name in os.listdir(backup_dir)
+            if name.startswith("money_manager_backup_")
+        ]
+    except FileNotFoundError:
+        return None
+
+    return max(backups, key=os.path.getmtime, default=None)
+
+
+def _copy_file(src_path: str, dst_path: str, size: int) -> None:
+    """Copy a file with os.sendfile, falling back to shutil.copyfile."""
+    try:
+        with open(src_path, "rb") as src, open(dst_path, "wb") as dst:
+            offset = 0
+            while offset < size:
+                sent = os.sendfile(dst.fileno(), src.fileno(), offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+    except (AttributeError, OSError):
+        # Platform without sendfile (or fd pair it refuses)
+        shutil.copyfile(src_path, dst_path)
+
 
 def backup_data(data_path="data/data.json", backup_dir="data/backups") -> bool:
     """
     Create a backup of the data file.
 
+    Skips the copy entirely when the data file is identical to the most
+    recent backup, and otherwise copies with os.sendfile (kernel-side
+    zero-copy on Linux), falling back to shutil.copyfile elsewhere.
+
     Args:
         data_path (str): Path to the data JSON file.
         backup_dir (str): Directory where backups will be stored.
@@ -154,7 +291,55 @@ def backup_data(data_path="data/data.json", backup_dir="data/backups") -> bool:
     backup_filepath = os.path.join(backup_dir, backup_filename)
 
     try:
-        shutil.copy(data_path, backup_filepath)
+        src_stat = os.stat(data_path)
+
+        # Skip the copy when nothing changed since the last backup
+        latest = _latest_backup(backup_dir)
+        if (
+            latest is not None
+            and os.stat(latest).st_size == src_stat.st_size
+            and filecmp.cmp(data_path, latest, shallow=False)
+        ):
+            return True
+
+        _copy_file(data_path, backup_filepath, src_stat.st_size)
         return True
     except Exception:
         return False
+
+
+def backup_many(files: list[str], backup_dir="data/backups") -> bool:
+    """
+    Back up several data files in one batch.
+
+    The backup directory check and timestamp are computed once for the
+    whole batch, so scripted periodic backups of many files pay the
+    setup cost a single time.
+
+    Args:
+        files (list[str]): Paths of the data files to back up.
+        backup_dir (str): Directory where backups will be stored.
+
+    Returns:
+        bool: True if every file was backed up, False if any copy failed.
+    """
+
+    if not os.path.exists(backup_dir):
+        os.makedirs(backup_dir)
+
+    # One timestamp shared by the whole batch
+    timestamp = datetime.datetime.now().strftime("%d-%m-%Y %H-%M-%S")
+
+    all_succeeded = True
+    for data_path in files:
+        stem, ext = os.path.splitext(os.path.basename(data_path))
+        backup_filepath = os.path.join(
+            backup_dir, f"{stem}_backup_{timestamp}{ext or '.json'}"
+        )
+
+        try:
+            _copy_file(data_path, backup_filepath, os.stat(data_path).st_size)
+        except Exception:
+            all_succeeded = False
+
+    return all_succeeded
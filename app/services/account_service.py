@@ -122,11 +122,17 @@ class AccountService:
         if new_name in self.accounts and new_name != old_name:
             raise AlreadyExistsError(f"An account named '{new_name}' already exists.")
 
-        # Update the account object's name and the dictionary key
+        # Update the account object's name and the dictionary key in one
+        # pop/assign pair; the account moves to the end of iteration
+        # order, which nothing here relies on
         account.account_name = new_name
-        # Remove old key and insert new key mapping to the same object
-        del self.accounts[old_name]
-        self.accounts[new_name] = account
+        self.accounts[new_name] = self.accounts.pop(old_name)
+
+        # Invalidate cached dicts: the account's own and those of its
+        # transactions, which embed the account name
+        account._dict_cache = None
+        for transaction in account.transactions:
+            transaction._dict_cache = None
 
         # Save changes
         self.money_manager.save()
@@ -155,14 +161,23 @@ class AccountService:
         if not account:
             raise NotFoundError(f"Account '{account_name}' does not exist.")
 
-        # Remove all transactions associated with this account
-        self.money_manager.transactions = [
-            t for t in self.money_manager.transactions if t.account != account
-        ]
+        # Remove the account's own transactions from the global list with
+        # an in-place two-pointer compaction: surviving rows shift left
+        # and the tail is deleted, so no replacement list is allocated and
+        # references to the list held by other services stay valid.
+        if account.transactions:
+            transactions = self.money_manager.transactions
+            write = 0
+            for trans in transactions:
+                if trans.account is not account:
+                    transactions[write] = trans
+                    write += 1
+            del transactions[write:]
 
         # Remove the account from the accounts dictionary
         del self.accounts[account_name]
 
         # Save changes
+        self.money_manager.txn_version += 1
         self.money_manager.save()
         return True
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections import Counter
+from itertools import chain
 from typing import TYPE_CHECKING
 
 from app.exception import AlreadyExistsError, CategoryInUseError, NotFoundError
@@ -28,6 +30,48 @@ class CategoryService:
         self.income_categories = money_manager.income_categories
         self.expense_categories = money_manager.expense_categories
 
+        # Lazily-built membership set across both types, dropped
+        # explicitly by every mutation here (the size check alone misses
+        # an add/delete pair that restores the combined count) and also
+        # rebuilt if the combined size drifts under external mutation.
+        # Per-type membership is already O(1) against the backing dicts.
+        self._all_category_set: frozenset[str] | None = None
+
+        # Lazily-built (transaction_type, category) -> count index so
+        # delete_category decides in O(1) instead of scanning every
+        # transaction; rebuilt when the transaction list mutates.
+        self._usage_index: tuple | None = None
+
+    def _category_usage(self) -> Counter:
+        """Return the (type, category) -> usage count index, resyncing if stale."""
+        transactions = self.money_manager.transactions
+        version = getattr(self.money_manager, "txn_version", 0)
+
+        cached = self._usage_index
+        if cached is None or cached[1] != version or cached[2] != len(transactions):
+            usage = Counter((t.transaction_type, t.category) for t in transactions)
+            cached = self._usage_index = (usage, version, len(transactions))
+
+        return cached[0]
+
+    def _category_dict(self, transaction_type: TransactionType) -> dict[str, None]:
+        """Return the backing category dict for a transaction type."""
+        return (
+            self.income_categories
+            if transaction_type is TransactionType.INCOME
+            else self.expense_categories
+        )
+
+    def _all_categories_set(self) -> frozenset[str]:
+        """Return the membership set across both types, resyncing if stale."""
+        cached = self._all_category_set
+        combined = len(self.income_categories) + len(self.expense_categories)
+        if cached is None or len(cached) != combined:
+            cached = self._all_category_set = frozenset(
+                chain(self.income_categories, self.expense_categories)
+            )
+        return cached
+
     def get_categories(self, transaction_type: TransactionType) -> list[str]:
         """
         Get a list of categories for a specific transaction type.
@@ -39,11 +83,7 @@ class CategoryService:
             list[str]: List of category names for the given type.
         """
 
-        return (
-            self.income_categories
-            if transaction_type == TransactionType.INCOME
-            else self.expense_categories
-        )
+        return list(self._category_dict(transaction_type))
 
     def get_all_categories(self) -> list[str]:
         """
@@ -53,7 +93,20 @@ class CategoryService:
             list[str]: Combined list of all categories.
         """
 
-        return self.income_categories + self.expense_categories
+        # chain avoids the intermediate list that list.__add__ builds
+        return list(chain(self.income_categories, self.expense_categories))
+
+    def is_known_category(self, category: str) -> bool:
+        """
+        Check whether a category exists under either transaction type.
+
+        Args:
+            category (str): The category name to check.
+
+        Returns:
+            bool: True if the category exists for income or expense.
+        """
+        return category in self._all_categories_set()
 
     def is_valid_category(
         self, category: str, transaction_type: TransactionType
@@ -68,7 +121,7 @@ class CategoryService:
         Returns:
             bool: True if category exists, False otherwise.
         """
-        return category in self.get_categories(transaction_type)
+        return category in self._category_dict(transaction_type)
 
     def add_category(self, category: str, transaction_type_input: str) -> None:
         """
@@ -89,16 +142,17 @@ class CategoryService:
         # Validate category name
         category = validate_non_empty_string(category, "Category name")
 
+        categories = self._category_dict(transaction_type)
+
         # Check if the category already exist
-        category_list = self.get_categories(transaction_type)
-        if category in category_list:
+        if category in categories:
             raise AlreadyExistsError(f"A category named '{category}' already exists.")
 
-        # Add the category to the appropriate list
-        if transaction_type == TransactionType.INCOME:
-            self.income_categories.append(category)
-        else:
-            self.expense_categories.append(category)
+        # Add the category to the appropriate mapping and drop the
+        # combined membership set; the length check alone can't see an
+        # add that cancels out a later delete
+        categories[category] = None
+        self._all_category_set = None
 
         # Save changes
         self.money_manager.save()
@@ -127,32 +181,43 @@ class CategoryService:
         old_category = validate_non_empty_string(old_category, "Old category name")
         new_category = validate_non_empty_string(new_category, "New category name")
 
-        # Get the appropriate category list
-        category_list = self.get_categories(transaction_type)
+        # Get the appropriate category mapping
+        categories = self._category_dict(transaction_type)
 
         # Check if old category exists
-        if old_category not in category_list:
+        if old_category not in categories:
             raise NotFoundError(
                 f"Category '{old_category}' not found in {transaction_type.value} categories."
             )
 
         # Check if new category already exists (and is different from old)
-        if new_category in category_list and new_category != old_category:
+        if new_category in categories and new_category != old_category:
             raise AlreadyExistsError(
                 f"Category '{new_category}' already exists. Choose a different name."
             )
 
-        # Update category in the list
-        category_list[category_list.index(old_category)] = new_category
+        # Rename in place, rebuilding once to preserve the original
+        # position; the size stays the same, so drop the combined set
+        # explicitly
+        renamed = {
+            (new_category if name == old_category else name): None
+            for name in categories
+        }
+        categories.clear()
+        categories.update(renamed)
+        self._all_category_set = None
 
         # Update all transactions that use this category
         for trans in self.money_manager.transactions:
             if (
                 trans.category == old_category
-                and trans.transaction_type == transaction_type
+                and trans.transaction_type is transaction_type
             ):
                 trans.category = new_category
+                # Invalidate the cached dict representation
+                trans._dict_cache = None
 
+        self.money_manager.txn_version += 1
         self.money_manager.save()
 
     def delete_category(self, category: str, transaction_type_input: str) -> bool:
@@ -178,26 +243,22 @@ class CategoryService:
         # Validate category name
         category = validate_non_empty_string(category, "Category name")
 
-        category_list = self.get_categories(transaction_type)
+        categories = self._category_dict(transaction_type)
 
         # Check if category exists
-        if category not in category_list:
+        if category not in categories:
             raise NotFoundError(f"Category '{category}' does not exist")
 
-        # Check if any transactions use this category
-        used_by = [
-            t
-            for t in self.money_manager.transactions
-            if t.category == category and t.transaction_type == transaction_type
-        ]
-
-        if used_by:
+        # Check if any transactions use this category (O(1) index lookup)
+        count = self._category_usage().get((transaction_type, category), 0)
+        if count:
             raise CategoryInUseError(
-                f"Category '{category}' is used by {len(used_by)} transaction(s)."
+                f"Category '{category}' is used by {count} transaction(s)."
             )
 
-        # Remove category and save changes
-        category_list.remove(category)
+        # Remove category, drop the combined membership set, and save
+        del categories[category]
+        self._all_category_set = None
         self.money_manager.save()
 
         return True
@@ -47,9 +47,8 @@ class FilterService:
         # Validate category name
         category = validate_non_empty_string(category, "Category name")
 
-        # Check if category exist
-        category_list = self.money_manager.category_service.get_all_categories()
-        if category not in category_list:
+        # Check if category exist (O(1) against the cached membership set)
+        if not self.money_manager.category_service.is_known_category(category):
             raise NotFoundError(f"Category '{category}' does not exist")
 
         # Filter transactions which having this category
@@ -78,12 +77,9 @@ class FilterService:
         if not account:
             raise NotFoundError(f"Account '{account_name}' does not exist.")
 
-        # Filter transactions which are realted to this account
-        return [
-            t
-            for t in self.transactions
-            if t.account.account_name == account.account_name
-        ]
+        # The account already holds its own transactions, so the global
+        # list never needs scanning
+        return list(account.transactions)
 
     def filter_transaction_by_transaction_type(self, transaction_type_input: str):
         """
@@ -2,15 +2,40 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from datetime import datetime, time, timedelta
 from decimal import Decimal
+from operator import attrgetter
 from typing import TYPE_CHECKING
 
 from app.models import TransactionType
+from app.utility import format_date, from_cents
 
 if TYPE_CHECKING:
     from app.money_manager import MoneyManager
 
+# Bucket boundary constants, built once at import instead of per query
+_DAY_START = time.min
+_DAY_END = time(23, 59, 59, 999999)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+# Month display names, indexed by month number - 1
+_MONTH_NAMES = (
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+)
+
 
 class SummaryService:
     """
@@ -31,6 +56,133 @@ class SummaryService:
         self.income_categories = money_manager.income_categories
         self.expense_categories = money_manager.expense_categories
 
+        # Lazily-built date index: (sorted datetimes, transactions in the
+        # same order, size snapshot). Rebuilt when the transaction list
+        # changes size, so repeated dashboard queries pay O(log n + k)
+        # instead of a full scan each.
+        self._date_index: tuple | None = None
+
+        # Memoized summary results keyed on the query arguments plus the
+        # manager's txn_version, so any mutation naturally invalidates
+        # every cached entry. The stamp of the last lookup is kept so the
+        # dict can be cleared when the version moves - stale-version keys
+        # can never hit again, so without this the memo would grow by one
+        # dead entry per query per mutation.
+        self._summary_cache: dict = {}
+        self._summary_cache_stamp: tuple | None = None
+
+    def _cache_key(self, *parts) -> tuple:
+        """Build a cache key that goes stale when transactions mutate."""
+        # getattr keeps fakes without a txn_version working; the length
+        # snapshot covers direct list mutation in that case
+        stamp = (
+            getattr(self.money_manager, "txn_version", 0),
+            len(self.transactions),
+        )
+        if stamp != self._summary_cache_stamp:
+            self._summary_cache.clear()
+            self._summary_cache_stamp = stamp
+        return parts + stamp
+
+    def _transactions_between(self, start: datetime, end: datetime) -> list:
+        """
+        Return the transactions dated within [start, end], both inclusive.
+
+        Uses a sorted auxiliary index and bisect, seeking the window in
+        O(log n) instead of scanning every transaction per query.
+
+        Args:
+            start (datetime): Inclusive start of the range.
+            end (datetime): Inclusive end of the range.
+
+        Returns:
+            list: Transactions inside the range, in chronological order.
+        """
+
+        transactions = self.transactions
+        version = getattr(self.money_manager, "txn_version", 0)
+        index = self._date_index
+        if index is None or index[2] != len(transactions) or index[3] != version:
+            ordered = sorted(transactions, key=attrgetter("datetime"))
+            index = self._date_index = (
+                [t.datetime for t in ordered],
+                ordered,
+                len(ordered),
+                version,
+            )
+
+        dates, ordered, _, _ = index
+        return ordered[bisect_left(dates, start) : bisect_right(dates, end)]
+
+    def _totals_between(self, start: datetime, end: datetime) -> tuple:
+        """
+        Accumulate income/expense totals for transactions within a date range.
+
+        Single pass over the transactions: no intermediate filtered list is
+        built, and the totals and count come out of the same loop.
+
+        Args:
+            start (datetime): Inclusive start of the range.
+            end (datetime): Inclusive end of the range.
+
+        Returns:
+            tuple: (total_income, total_expense, transaction_count)
+        """
+
+        # Accumulate in integer cents: int adds are far cheaper than
+        # Decimal adds and allocate nothing per iteration
+        total_income = 0
+        total_expense = 0
+        count = 0
+        income = TransactionType.INCOME
+
+        for trans in self._transactions_between(start, end):
+            # Identity check: enum members are singletons
+            if trans.transaction_type is income:
+                total_income += trans.amount_cents
+            else:
+                total_expense += trans.amount_cents
+            count += 1
+
+        return from_cents(total_income), from_cents(total_expense), count
+
+    def _category_totals_between(
+        self, start: datetime, end: datetime, transaction_type: TransactionType
+    ) -> tuple[dict, Decimal]:
+        """
+        Group amounts by category for one transaction type within a range.
+
+        Filter and grouping are fused into a single pass; defaultdict
+        removes the per-transaction membership branch, and sums stay in
+        integer cents until the return boundary.
+
+        Args:
+            start (datetime): Inclusive start of the range.
+            end (datetime): Inclusive end of the range.
+            transaction_type (TransactionType): Type to group (INCOME or EXPENSE).
+
+        Returns:
+            tuple[dict, Decimal]: Mapping of category name -> total amount,
+                and the overall total accumulated in the same pass.
+        """
+
+        cents_by_category: defaultdict[str, int] = defaultdict(int)
+        total_cents = 0
+
+        for trans in self._transactions_between(start, end):
+            if trans.transaction_type is transaction_type:
+                cents = trans.amount_cents
+                cents_by_category[trans.category] += cents
+                total_cents += cents
+
+        return (
+            {
+                category: from_cents(cents)
+                for category, cents in cents_by_category.items()
+            },
+            from_cents(total_cents),
+        )
+
     def get_daily_summary(self, date: datetime):
         """
         Generate a financial summary for a specific day.
@@ -43,33 +195,22 @@ class SummaryService:
         """
 
         # Set the day start and end boundaries
-        start_of_day = date.replace(hour=0, minute=0, second=0, microsecond=0)
-        end_of_day = date.replace(hour=23, minute=59, second=59, microsecond=999999)
-
-        # Filter transactions happen on this day
-        transactions = [
-            t for t in self.transactions if start_of_day <= t.datetime <= end_of_day
-        ]
-
-        # Initialize amount
-        total_income = Decimal("0.00")
-        total_expense = Decimal("0.00")
-
-        # Handling summary
-        for trans in transactions:
-            if trans.transaction_type == TransactionType.INCOME:
-                total_income += trans.amount
-            else:
-                total_expense += trans.amount
+        start_of_day = datetime.combine(date.date(), _DAY_START)
+        end_of_day = datetime.combine(date.date(), _DAY_END)
+
+        # Accumulate totals for this day in a single pass
+        total_income, total_expense, count = self._totals_between(
+            start_of_day, end_of_day
+        )
 
         net = total_income - total_expense
 
         return {
-            "date": date.strftime("%d-%m-%Y"),
+            "date": format_date(date),
             "total_income": total_income,
             "total_expense": total_expense,
             "net": net,
-            "transaction_count": len(transactions),
+            "transaction_count": count,
         }
 
     def get_weekly_summary(self, date: datetime):
@@ -88,38 +229,35 @@ class SummaryService:
         iso_year, iso_week, iso_weekday = date.isocalendar()
 
         # Calculate Monday of this week (start of week)
-        week_start = date - timedelta(days=iso_weekday - 1)
-        week_start = week_start.replace(hour=0, minute=0, second=0, microsecond=0)
+        week_start = datetime.combine(
+            date.date() - timedelta(days=iso_weekday - 1), _DAY_START
+        )
 
         # Calculate Sunday of this week (end of week)
-        week_end = week_start + timedelta(days=6)
-        week_end = week_end.replace(hour=23, minute=59, second=59, microsecond=999999)
-
-        # Filter transactions for this week
-        week_transactions = [
-            t for t in self.transactions if week_start <= t.datetime <= week_end
-        ]
+        week_end = datetime.combine(week_start.date() + timedelta(days=6), _DAY_END)
 
-        # Calculate totals
-        total_income = Decimal("0.00")
-        total_expense = Decimal("0.00")
+        # Serve repeated queries for the same week from the memo; hand
+        # back a copy so callers can't mutate the cached entry
+        key = self._cache_key("weekly", week_start)
+        cached = self._summary_cache.get(key)
+        if cached is not None:
+            return dict(cached)
 
-        for trans in week_transactions:
-            if trans.transaction_type == TransactionType.INCOME:
-                total_income += trans.amount
-            else:
-                total_expense += trans.amount
+        # Accumulate totals for this week in a single pass
+        total_income, total_expense, count = self._totals_between(week_start, week_end)
 
         net = total_income - total_expense
 
-        return {
-            "week_start": week_start.strftime("%d-%m-%Y"),
-            "week_end": week_end.strftime("%d-%m-%Y"),
+        summary = {
+            "week_start": format_date(week_start),
+            "week_end": format_date(week_end),
             "total_income": total_income,
             "total_expense": total_expense,
             "net": net,
-            "transaction_count": len(week_transactions),
+            "transaction_count": count,
         }
+        self._summary_cache[key] = summary
+        return dict(summary)
 
     def get_monthly_summary(self, year: int, month: int) -> dict:
         """
@@ -139,64 +277,48 @@ class SummaryService:
             return {}
 
         # Get month name
-        month_names = [
-            "January",
-            "February",
-            "March",
-            "April",
-            "May",
-            "June",
-            "July",
-            "August",
-            "September",
-            "October",
-            "November",
-            "December",
-        ]
-        month_name = month_names[month - 1]
+        month_name = _MONTH_NAMES[month - 1]
+
+        # Serve repeated queries for the same month from the memo; hand
+        # back a copy so callers can't mutate the cached entry
+        key = self._cache_key("monthly", year, month)
+        cached = self._summary_cache.get(key)
+        if cached is not None:
+            return dict(cached)
 
         # Calculate first day of month
         month_start = datetime(year, month, 1, 0, 0, 0)
 
-        # Calculate last day of month
-        # Get first day of next month, then subtract one day
+        # Calculate end of month: one microsecond before the first day of
+        # the next month
         if month == 12:
             next_month = datetime(year + 1, 1, 1)
         else:
             next_month = datetime(year, month + 1, 1)
 
-        month_end = next_month - timedelta(days=1)
-        month_end = month_end.replace(hour=23, minute=59, second=59, microsecond=999999)
+        month_end = next_month - _ONE_MICROSECOND
 
-        # Filter transactions for this month
-        month_transactions = [
-            t for t in self.transactions if month_start <= t.datetime <= month_end
-        ]
-
-        # Calculate totals
-        total_income = Decimal("0.00")
-        total_expense = Decimal("0.00")
-
-        for trans in month_transactions:
-            if trans.transaction_type == TransactionType.INCOME:
-                total_income += trans.amount
-            else:
-                total_expense += trans.amount
+        # Accumulate totals for this month in a single pass
+        total_income, total_expense, count = self._totals_between(
+            month_start, month_end
+        )
 
         net = total_income - total_expense
 
-        return {
+        summary = {
             "month": month_name,
             "year": year,
             "total_income": total_income,
             "total_expense": total_expense,
             "net": net,
-            "transaction_count": len(month_transactions),
+            "transaction_count": count,
         }
+        self._summary_cache[key] = summary
+        return dict(summary)
 
     def get_expenses_by_category(
         self, start_date: datetime, end_date: datetime
-    ) -> dict:
+    ) -> tuple[dict, Decimal]:
         """
         Summarize total expenses grouped by category within a date range.
 
@@ -205,37 +327,35 @@ class SummaryService:
             end_date (datetime): End date of range.
 
         Returns:
-            dict: Mapping of category name -> total expense amount.
+            tuple[dict, Decimal]: Mapping of category name -> total expense
+                amount, and the overall total accumulated in the same pass.
         """
 
         # Validate dates
         if start_date > end_date:
-            return {}
+            return {}, Decimal("0.00")
 
         # Set time boundaries
-        start_of_day = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
-        end_of_day = end_date.replace(hour=23, minute=59, second=59, microsecond=999999)
-
-        # Filter expense transactions for this date range
-        expense_transactions = [
-            t
-            for t in self.transactions
-            if start_of_day <= t.datetime <= end_of_day
-            and t.transaction_type == TransactionType.EXPENSE
-        ]
-
-        # Group by category
-        expenses_by_category = {}
-
-        for trans in expense_transactions:
-            category = trans.category
-            if category not in expenses_by_category:
-                expenses_by_category[category] = Decimal("0.00")
-            expenses_by_category[category] += trans.amount
-
-        return expenses_by_category
-
-    def get_income_by_category(self, start_date: datetime, end_date: datetime) -> dict:
+        start_of_day = datetime.combine(start_date.date(), _DAY_START)
+        end_of_day = datetime.combine(end_date.date(), _DAY_END)
+
+        # Serve repeated queries for the same range from the memo; hand
+        # back a copy so callers can't mutate the cached entry
+        key = self._cache_key("expenses", start_of_day, end_of_day)
+        cached = self._summary_cache.get(key)
+        if cached is not None:
+            by_category, total = cached
+            return dict(by_category), total
+
+        by_category, total = self._category_totals_between(
+            start_of_day, end_of_day, TransactionType.EXPENSE
+        )
+        self._summary_cache[key] = (by_category, total)
+        return dict(by_category), total
+
+    def get_income_by_category(
+        self, start_date: datetime, end_date: datetime
+    ) -> tuple[dict, Decimal]:
         """
         Summarize total income grouped by category within a date range.
 
@@ -244,32 +364,28 @@ class SummaryService:
             end_date (datetime): End date of range.
 
         Returns:
-            dict: Mapping of category name -> total income amount.
+            tuple[dict, Decimal]: Mapping of category name -> total income
+                amount, and the overall total accumulated in the same pass.
         """
 
         # Validate dates
         if start_date > end_date:
-            return {}
+            return {}, Decimal("0.00")
 
         # Set time boundaries
-        start_of_day = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
-        end_of_day = end_date.replace(hour=23, minute=59, second=59, microsecond=999999)
-
-        # Filter income transactions for this date range
-        income_transactions = [
-            t
-            for t in self.transactions
-            if start_of_day <= t.datetime <= end_of_day
-            and t.transaction_type == TransactionType.INCOME
-        ]
-
-        # Group by category
-        income_by_category = {}
-
-        for trans in income_transactions:
-            category = trans.category
-            if category not in income_by_category:
-                income_by_category[category] = Decimal("0.00")
-            income_by_category[category] += trans.amount
-
-        return income_by_category
+        start_of_day = datetime.combine(start_date.date(), _DAY_START)
+        end_of_day = datetime.combine(end_date.date(), _DAY_END)
+
+        # Serve repeated queries for the same range from the memo; hand
+        # back a copy so callers can't mutate the cached entry
+        key = self._cache_key("income", start_of_day, end_of_day)
+        cached = self._summary_cache.get(key)
+        if cached is not None:
+            by_category, total = cached
+            return dict(by_category), total
+
+        by_category, total = self._category_totals_between(
+            start_of_day, end_of_day, TransactionType.INCOME
+        )
+        self._summary_cache[key] = (by_category, total)
+        return dict(by_category), total
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from operator import attrgetter
 from typing import TYPE_CHECKING
 
 from app.exception import NotFoundError
@@ -33,6 +34,81 @@ class TransactionService:
         self.money_manager = money_manager
         self.transactions = money_manager.transactions
 
+        # Lazily-built transaction_id -> Transaction index:
+        # (dict, version, size). Kept fresh incrementally by this
+        # service's own mutations and rebuilt when the list is changed
+        # elsewhere (e.g. account deletion), so lookups are O(1).
+        self._id_index: tuple | None = None
+
+        # Lazily-built transaction_id -> list position index backing the
+        # O(1) swap-pop delete; same staleness stamp as the ID index
+        self._pos_index: tuple | None = None
+
+        # Cached next auto-increment ID: (next_id, version, size),
+        # recomputed only when the list was changed elsewhere
+        self._next_id: tuple | None = None
+
+        # Cached chronologically sorted views in both directions:
+        # (ascending, descending, version, size), so repeated menu
+        # redraws skip the O(n log n) sort
+        self._sorted_cache: tuple | None = None
+
+    def _by_id(self) -> dict:
+        """Return the id -> transaction mapping, resyncing if stale."""
+        transactions = self.transactions
+        version = getattr(self.money_manager, "txn_version", 0)
+
+        index = self._id_index
+        if index is None or index[1] != version or index[2] != len(transactions):
+            index = self._id_index = (
+                {t.transaction_id: t for t in transactions},
+                version,
+                len(transactions),
+            )
+
+        return index[0]
+
+    def _positions(self) -> dict:
+        """Return the id -> list position mapping, resyncing if stale."""
+        transactions = self.transactions
+        version = getattr(self.money_manager, "txn_version", 0)
+
+        index = self._pos_index
+        if index is None or index[1] != version or index[2] != len(transactions):
+            index = self._pos_index = (
+                {t.transaction_id: i for i, t in enumerate(transactions)},
+                version,
+                len(transactions),
+            )
+
+        return index[0]
+
+    def _freshen_indexes(self, prev_version: int, prev_size: int) -> None:
+        """Re-stamp the lazy indexes after one of this service's own mutations.
+
+        Only an index whose stamp matched the pre-mutation (version, size)
+        was verifiably fresh when the mutation began; re-stamping anything
+        else would launder contents that predate an external mutation
+        (e.g. an account deletion compacting the list). Stale indexes are
+        dropped so the next lookup rebuilds them.
+        """
+        version = getattr(self.money_manager, "txn_version", 0)
+        size = len(self.transactions)
+        index = self._id_index
+        if index is not None:
+            self._id_index = (
+                (index[0], version, size)
+                if index[1] == prev_version and index[2] == prev_size
+                else None
+            )
+        index = self._pos_index
+        if index is not None:
+            self._pos_index = (
+                (index[0], version, size)
+                if index[1] == prev_version and index[2] == prev_size
+                else None
+            )
+
     @property
     def next_transaction_id(self) -> int:
         """
@@ -41,10 +117,15 @@ class TransactionService:
         Returns:
             int: The next transaction ID.
         """
-        if self.transactions:
-            return max(t.transaction_id for t in self.transactions) + 1
+        transactions = self.transactions
+        version = getattr(self.money_manager, "txn_version", 0)
 
-        return 1
+        cached = self._next_id
+        if cached is None or cached[1] != version or cached[2] != len(transactions):
+            next_id = max((t.transaction_id for t in transactions), default=0) + 1
+            cached = self._next_id = (next_id, version, len(transactions))
+
+        return cached[0]
 
     def add_transaction(
         self,
@@ -92,8 +173,9 @@ class TransactionService:
         if not account:
             raise NotFoundError(f"Account '{account_name}' does not exist.")
 
-        # Validate amount is positive
-        validate_non_negative_amount(amount, "Transaction amount")
+        # Validate amount is positive; keep the parsed Decimal so the
+        # string isn't converted a second time in the constructor
+        amount_decimal = validate_non_negative_amount(amount, "Transaction amount")
 
         # Timestamp always set to current time
         timestamp = get_current_time()
@@ -105,21 +187,149 @@ class TransactionService:
             transaction_type=transaction_type,
             category=category,
             account=account,
-            amount=amount,
+            amount=amount_decimal,
             description=description,
         )
 
         # Update account balance
         account.update_balance(transaction.amount, transaction_type)
 
+        # Stamp of the state the lazy indexes must match to be patched
+        # in place rather than rebuilt
+        prev_version = getattr(self.money_manager, "txn_version", 0)
+        prev_size = len(self.transactions)
+
         # Add to collections
         self.transactions.append(transaction)
         account.add_transaction(transaction)
 
         # Save changes
+        self.money_manager.txn_version += 1
+        if self._id_index is not None and self._id_index[1:] == (
+            prev_version,
+            prev_size,
+        ):
+            self._id_index[0][transaction.transaction_id] = transaction
+        if self._pos_index is not None and self._pos_index[1:] == (
+            prev_version,
+            prev_size,
+        ):
+            self._pos_index[0][transaction.transaction_id] = (
+                len(self.transactions) - 1
+            )
+        self._freshen_indexes(prev_version, prev_size)
+        # The new highest ID is known without another scan
+        self._next_id = (
+            transaction.transaction_id + 1,
+            getattr(self.money_manager, "txn_version", 0),
+            len(self.transactions),
+        )
         self.money_manager.save()
         return transaction
 
+    def bulk_add(self, rows: list[dict]) -> list[Transaction]:
+        """
+        Add many transactions in one pass with a single file write.
+
+        Importing N rows through add_transaction serializes and rewrites
+        the data file N times and re-stamps the indexes per row. This
+        validates every row up front (so a bad row mid-import leaves
+        nothing behind), appends them all, patches the lazy indexes once
+        with dict.update, and saves once via money_manager.batch().
+
+        Args:
+            rows (list[dict]): Row dicts with the add_transaction fields:
+                transaction_type, category, account_name, amount, and an
+                optional description.
+
+        Returns:
+            list[Transaction]: The newly created transactions, in input order.
+
+        Raises:
+            InvalidInputError: For invalid transaction type or amount.
+            NotFoundError: If a category or account doesn't exist.
+        """
+
+        category_service = self.money_manager.category_service
+        account_service = self.money_manager.account_service
+
+        # Validate everything before mutating anything
+        prepared = []
+        for row in rows:
+            transaction_type = validate_transaction_type(row["transaction_type"])
+
+            category = validate_non_empty_string(row["category"], "Category name")
+            if not category_service.is_valid_category(category, transaction_type):
+                raise NotFoundError(f"Category '{category}' does not exist")
+
+            account_name = validate_non_empty_string(
+                row["account_name"], "Account name"
+            )
+            account = account_service.get_account(account_name)
+            if not account:
+                raise NotFoundError(f"Account '{account_name}' does not exist.")
+
+            amount = validate_non_negative_amount(row["amount"], "Transaction amount")
+
+            prepared.append(
+                (transaction_type, category, account, amount, row.get("description", ""))
+            )
+
+        transactions = self.transactions
+        next_id = self.next_transaction_id
+        timestamp = get_current_time()
+        created = []
+
+        # Stamp of the state the lazy indexes must match to be patched
+        # in place rather than rebuilt
+        prev_version = getattr(self.money_manager, "txn_version", 0)
+        prev_size = len(transactions)
+
+        with self.money_manager.batch():
+            for transaction_type, category, account, amount, description in prepared:
+                transaction = Transaction(
+                    transaction_id=next_id,
+                    datetime=timestamp,
+                    transaction_type=transaction_type,
+                    category=category,
+                    account=account,
+                    amount=amount,
+                    description=description,
+                )
+                next_id += 1
+
+                account.update_balance(transaction.amount, transaction_type)
+                transactions.append(transaction)
+                account.add_transaction(transaction)
+                created.append(transaction)
+
+            # One version bump and one index patch for the whole batch
+            self.money_manager.txn_version += 1
+            if self._id_index is not None and self._id_index[1:] == (
+                prev_version,
+                prev_size,
+            ):
+                self._id_index[0].update(
+                    (t.transaction_id, t) for t in created
+                )
+            if self._pos_index is not None and self._pos_index[1:] == (
+                prev_version,
+                prev_size,
+            ):
+                start = len(transactions) - len(created)
+                self._pos_index[0].update(
+                    (t.transaction_id, start + i) for i, t in enumerate(created)
+                )
+            self._freshen_indexes(prev_version, prev_size)
+            self._next_id = (
+                next_id,
+                getattr(self.money_manager, "txn_version", 0),
+                len(transactions),
+            )
+            self.money_manager.save()
+
+        return created
+
     def get_transaction(self, transaction_id: int):
         """
         Retrieve a transaction by its ID.
@@ -130,10 +340,7 @@ class TransactionService:
         Returns:
             Transaction | None: The transaction object, or None if not found.
         """
-        for trans in self.transactions:
-            if trans.transaction_id == transaction_id:
-                return trans
-        return None
+        return self._by_id().get(transaction_id)
 
     def get_all_transactions(self, reverse_chronological: bool = True):
         """
@@ -145,9 +352,30 @@ class TransactionService:
         Returns:
             list[Transaction]: Sorted list of transactions.
         """
-        return sorted(
-            self.transactions, key=lambda t: t.datetime, reverse=reverse_chronological
-        )
+        transactions = self.transactions
+        version = getattr(self.money_manager, "txn_version", 0)
+
+        cached = self._sorted_cache
+        if cached is None or cached[2] != version or cached[3] != len(transactions):
+            # attrgetter fetches the sort key at C level, avoiding a
+            # Python frame per transaction
+            ascending = sorted(transactions, key=attrgetter("datetime"))
+            # The descending view gets its own stable sort rather than
+            # reversed(ascending): same-second transactions must keep
+            # their insertion order in both directions, and resorting an
+            # already-ordered list is a single O(n) merge run
+            descending = sorted(
+                ascending, key=attrgetter("datetime"), reverse=True
+            )
+            cached = self._sorted_cache = (
+                ascending,
+                descending,
+                version,
+                len(transactions),
+            )
+
+        # Return a fresh list so callers can't mutate the cached order
+        return list(cached[1]) if reverse_chronological else list(cached[0])
 
     def edit_transaction(
         self,
@@ -187,17 +415,23 @@ class TransactionService:
         old_amount = transaction.amount
         old_transaction_type = transaction.transaction_type
 
-        # Process and validate new inputs
+        # Process and validate new inputs, stripping each field once up
+        # front instead of per check (the validators' own strip is then a
+        # no-op returning the same string)
+        transaction_type_input = transaction_type_input.strip()
+        category = category.strip()
+        account_name = account_name.strip()
+        amount = amount.strip()
 
         # Transaction Type - only update if non-empty
         new_transaction_type = old_transaction_type
-        if transaction_type_input.strip():
+        if transaction_type_input:
             new_transaction_type = validate_transaction_type(transaction_type_input)
 
         # Category - only update if non-empty
         new_category = transaction.category
-        if category.strip():
-            new_category = category.strip().capitalize()
+        if category:
+            new_category = category.capitalize()
             # Validate category against the (potentially) new transaction type
             if not self.money_manager.category_service.is_valid_category(
                 new_category, new_transaction_type
@@ -208,7 +442,7 @@ class TransactionService:
 
         # Account - only update if non-empty
         new_account = old_account
-        if account_name.strip():
+        if account_name:
             new_account_name = validate_non_empty_string(account_name, "Account name")
             new_account = self.money_manager.account_service.get_account(
                 new_account_name
@@ -218,16 +452,34 @@ class TransactionService:
 
         # Amount - only update if non-empty
         new_amount = old_amount
-        if amount.strip():
+        if amount:
             new_amount = validate_non_negative_amount(amount, "Transaction amount")
 
         # Description - always update (can be set to empty)
         new_description = description.strip()
 
+        # Work out whether the balances are affected at all; category and
+        # description edits don't touch them
+        balance_changed = (
+            new_transaction_type is not old_transaction_type
+            or new_account is not old_account
+            or new_amount != old_amount
+        )
+
+        # A submission that changes nothing skips the balance churn and
+        # the full-dataset save entirely
+        if (
+            not balance_changed
+            and new_category == transaction.category
+            and new_description == transaction.description
+        ):
+            return transaction
+
         # Reverse the original transaction's impact
-        old_account.reverse_balance(old_amount, old_transaction_type)
-        if old_account is not new_account:
-            old_account.remove_transaction(transaction)
+        if balance_changed:
+            old_account.reverse_balance(old_amount, old_transaction_type)
+            if old_account is not new_account:
+                old_account.remove_transaction(transaction)
 
         # Update the Transaction object
         transaction.transaction_type = new_transaction_type
@@ -236,13 +488,25 @@ class TransactionService:
         transaction.amount = new_amount
         transaction.description = new_description
 
-        # Add to new account if changed
-        if old_account is not new_account:
-            new_account.add_transaction(transaction)
+        # Invalidate the cached dict representation
+        transaction._dict_cache = None
+
+        if balance_changed:
+            # Add to new account if changed
+            if old_account is not new_account:
+                new_account.add_transaction(transaction)
+
+            # Apply the new transaction's impact
+            new_account.update_balance(new_amount, new_transaction_type)
 
-        # Apply the new transaction's impact
-        new_account.update_balance(new_amount, new_transaction_type)
+        # Stamp of the state the lazy indexes must match to be re-stamped
+        # rather than rebuilt; an edit leaves the list size unchanged
+        prev_version = getattr(self.money_manager, "txn_version", 0)
+        prev_size = len(self.transactions)
 
+        self.money_manager.txn_version += 1
+        # The ID didn't change, so only the index stamps need updating
+        self._freshen_indexes(prev_version, prev_size)
         self.money_manager.save()
         return transaction
 
@@ -275,9 +539,31 @@ class TransactionService:
         # Remove transaction from the account's list
         account.remove_transaction(transaction)
 
-        # Remove transaction from the global list
-        self.transactions.remove(transaction)
+        # Remove transaction from the global list with a swap-pop: the
+        # last row fills the gap, so no tail shifting or linear scan.
+        # Raw list order is irrelevant - views sort on demand.
+        transactions = self.transactions
+        positions = self._positions()
+
+        # Stamp of the state the lazy indexes must match to be patched
+        # in place rather than rebuilt; _positions() above just validated
+        # against this stamp
+        prev_version = getattr(self.money_manager, "txn_version", 0)
+        prev_size = len(transactions)
+
+        idx = positions.pop(transaction_id)
+        last = transactions.pop()
+        if idx != len(transactions):
+            transactions[idx] = last
+            positions[last.transaction_id] = idx
 
         # Save changes
+        self.money_manager.txn_version += 1
+        if self._id_index is not None and self._id_index[1:] == (
+            prev_version,
+            prev_size,
+        ):
+            del self._id_index[0][transaction_id]
+        self._freshen_indexes(prev_version, prev_size)
         self.money_manager.save()
         return True
@@ -2,17 +2,21 @@
 
 from __future__ import annotations
 
+import sys
 from datetime import datetime
 from decimal import ROUND_HALF_UP, Decimal
-from typing import TYPE_CHECKING
+from functools import lru_cache
 
+from app.enums import TransactionType
 from app.exception import InvalidInputError
 
-if TYPE_CHECKING:
-    from app.models import TransactionType
-
 DATETIME_FORMAT = "%d-%m-%Y %H:%M:%S"
 
+# Decimal constants built once at import; Decimal-from-string parsing is
+# pure Python and shows up on bulk validation/format paths
+_CENT = Decimal("0.01")
+_ZERO = Decimal("0.00")
+
 
 def format_datetime(dt: datetime) -> str:
     """
@@ -24,7 +28,25 @@ def format_datetime(dt: datetime) -> str:
     Returns:
         str: Formatted datetime string in DD-MM-YYYY HH:MM:SS format
     """
-    return dt.strftime(DATETIME_FORMAT)
+    # f-string formatting skips strftime's format-string interpreter,
+    # which matters when serializing many transactions per view/save
+    return (
+        f"{dt.day:02d}-{dt.month:02d}-{dt.year:04d} "
+        f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
+    )
+
+
+def format_date(dt: datetime) -> str:
+    """
+    Convert a datetime object to a formatted date-only string.
+
+    Args:
+        dt (datetime): The datetime object to format
+
+    Returns:
+        str: Formatted date string in DD-MM-YYYY format
+    """
+    return f"{dt.day:02d}-{dt.month:02d}-{dt.year:04d}"
 
 
 def parse_datetime(dt_str: str) -> datetime:
@@ -40,6 +62,21 @@ def parse_datetime(dt_str: str) -> datetime:
     Raises:
         ValueError: If the string doesn't match the expected format
     """
+    # Fixed-width fast path: slice the zero-padded fields directly and
+    # skip strptime's per-call format interpretation. Anything that
+    # doesn't fit falls back to strptime for identical error behaviour.
+    if len(dt_str) == 19:
+        try:
+            return datetime(
+                int(dt_str[6:10]),
+                int(dt_str[3:5]),
+                int(dt_str[0:2]),
+                int(dt_str[11:13]),
+                int(dt_str[14:16]),
+                int(dt_str[17:19]),
+            )
+        except ValueError:
+            pass
     return datetime.strptime(dt_str, DATETIME_FORMAT)
 
 
@@ -55,7 +92,65 @@ def format_amount(amount: str) -> Decimal:
     """
 
     # Convert to Decimal and quantize to 0.01 (2 decimal places)
-    return Decimal(amount).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+    return Decimal(amount).quantize(_CENT, rounding=ROUND_HALF_UP)
+
+
+def to_cents(amount: str) -> int:
+    """
+    Convert an amount string to integer cents.
+
+    Plain "[-]digits[.up-to-2-digits]" strings are parsed directly with int(),
+    which is much cheaper than the general Decimal constructor. Anything else
+    (more than 2 decimals, exponents, invalid text) falls back to the Decimal
+    path so rounding and error behaviour stay identical.
+
+    Args:
+        amount (str): The amount to convert (rounded half-up to 2 decimals)
+
+    Returns:
+        int: The amount in cents
+    """
+
+    if isinstance(amount, Decimal):
+        # Already-validated Decimals convert with a single scaleb; only
+        # values with more than 2 decimals need the rounding fallback
+        if amount.as_tuple().exponent >= -2:
+            return int(amount.scaleb(2))
+        return int(format_amount(amount).scaleb(2))
+
+    s = amount.strip() if isinstance(amount, str) else str(amount)
+    negative = s.startswith("-")
+    if negative:
+        s = s[1:]
+
+    try:
+        dot = s.find(".")
+        if dot < 0:
+            value = int(s) * 100
+        else:
+            fraction = s[dot + 1 :]
+            if len(fraction) > 2:
+                # Needs rounding - let the Decimal path handle it
+                raise ValueError
+            value = int(s[:dot]) * 100 + int((fraction + "00")[:2])
+    except ValueError:
+        return int(format_amount(amount).scaleb(2))
+
+    return -value if negative else value
+
+
+def from_cents(cents: int) -> Decimal:
+    """
+    Convert integer cents back to a two-decimal Decimal amount.
+
+    Args:
+        cents (int): The amount in cents
+
+    Returns:
+        Decimal: Amount with 2 decimal places
+    """
+
+    return Decimal(cents).scaleb(-2)
 
 
 def get_current_time() -> datetime:
@@ -69,6 +164,46 @@ def get_current_time() -> datetime:
     return datetime.now().replace(microsecond=0)
 
 
+# Iterator over pre-read stdin lines, filled lazily on first buffered_input
+# call when stdin is piped (non-tty)
+_stdin_lines = None
+
+
+def buffered_input(prompt: str = "") -> str:
+    """
+    Read one line of user input, buffering piped stdin in a single read.
+
+    When stdin is a terminal this behaves exactly like input(). When stdin
+    is piped (e.g. scripted runs or tests), the whole stream is read once
+    and lines are served from memory, avoiding one read syscall per prompt.
+
+    Args:
+        prompt (str): The prompt message to display to the user
+
+    Returns:
+        str: The next line of input without its trailing newline
+
+    Raises:
+        EOFError: If the buffered input is exhausted
+    """
+    global _stdin_lines
+
+    if sys.stdin.isatty():
+        return input(prompt)
+
+    if _stdin_lines is None:
+        _stdin_lines = iter(sys.stdin.read().splitlines())
+
+    # Echo the prompt like input() does (no trailing newline)
+    if prompt:
+        sys.stdout.write(prompt)
+
+    try:
+        return next(_stdin_lines)
+    except StopIteration:
+        raise EOFError("No more input available")
+
+
 def read_integer(prompt: str) -> int:
     """
     Prompt user for integer input with validation.
@@ -83,7 +218,7 @@ def read_integer(prompt: str) -> int:
     while True:
         try:
             # Attempt to convert user input to integer
-            return int(input(prompt))
+            return int(buffered_input(prompt))
         except ValueError:
             # Invalid input - show error and retry
             print("You must input a valid integer!")
@@ -150,7 +285,7 @@ def read_float(prompt: str) -> float:
     while True:
         try:
             # Attempt to convert user input to float
-            return float(input(prompt))
+            return float(buffered_input(prompt))
         except ValueError:
             # Invalid input - show error and retry
             print("You must input a valid float!")
@@ -218,7 +353,7 @@ def validate_non_empty_string(value: str, field_name: str = "Value") -> str:
         field_name (str): Name of the field for error messages (default: "Value")
 
     Returns:
-        str: The stripped and capitalized value
+        str: The stripped and capitalized value, interned
 
     Raises:
         InvalidInputError: If the string is empty after stripping
@@ -226,13 +361,20 @@ def validate_non_empty_string(value: str, field_name: str = "Value") -> str:
     stripped_value = value.strip().capitalize()
     if not stripped_value:
         raise InvalidInputError(f"{field_name} cannot be empty.")
-    return stripped_value
+    # Account and category names flow into dict keys and repeated
+    # lookups; interning makes those hash/compare by pointer first
+    return sys.intern(stripped_value)
 
 
-def validate_transaction_type(transaction_type_input: str) -> "TransactionType":
+@lru_cache(maxsize=8)
+def validate_transaction_type(transaction_type_input: str) -> TransactionType:
     """
     Validate and convert a transaction type string to TransactionType enum.
 
+    Only a handful of distinct inputs ever occur, so results are cached;
+    repeated calls skip the strip/lower and enum lookup entirely. Invalid
+    inputs raise and are never cached.
+
     Args:
         transaction_type_input (str): The transaction type string (e.g., "income", "EXPENSE")
 
@@ -242,8 +384,6 @@ def validate_transaction_type(transaction_type_input: str) -> "TransactionType":
     Raises:
         InvalidInputError: If the string is not a valid transaction type
     """
-    from app.models import TransactionType
-
     try:
         return TransactionType(transaction_type_input.strip().lower())
     except ValueError:
@@ -267,6 +407,6 @@ def validate_non_negative_amount(amount: str, field_name: str = "Amount") -> Dec
         InvalidInputError: If the amount is negative
     """
     decimal_amount = format_amount(amount)
-    if decimal_amount < Decimal("0.00"):
+    if decimal_amount < _ZERO:
         raise InvalidInputError(f"{field_name} cannot be negative.")
     return decimal_amount
@@ -24,22 +24,26 @@ def choose_and_run(money_manager, actions_list):
 
     quit_program = False
 
-    while not quit_program:
+    # The action list never changes during a session, so the menu text
+    # and option count are built once instead of per redraw
+    menu_text = "\n--- Money Tracker Menu ---\n" + "\n".join(
+        f"{index}: {action.show_option()}"
+        for index, action in enumerate(actions_list, 1)
+    )
+    option_count = len(actions_list)
 
-        print("\n--- Money Tracker Menu ---")
+    while not quit_program:
 
-        # Display menu options
-        for index, action in enumerate(actions_list, 1):
-            print(f"{index}: {action.show_option()}")
+        print(menu_text)
 
         # Prompt user for input and validate as integer
         option: int = read_integer("Select an option: ")
         print()
 
         # Handle option
-        if option == len(actions_list):
+        if option == option_count:
             quit_program = True
-        elif 1 <= option < len(actions_list):
+        elif 1 <= option < option_count:
             actions_list[option - 1].run(money_manager)
         else:
             print("Invalid option. Try again")
@@ -14,6 +14,7 @@ class FakeMoneyManager:
     def __init__(self) -> None:
         self.accounts = {}
         self.transactions = []
+        self.txn_version = 0
         self.save = MagicMock()
 
 
@@ -218,12 +219,13 @@ class TestDeleteAccount:
         # Add account
         account = account_service.add_account("Checking", "100.00")
 
-        # Add related transactions
-        account_service.money_manager.transactions = [
-            MagicMock(account=account),
-            MagicMock(account=account),
-            MagicMock(account=MagicMock(account_name="Other")),
-        ]
+        # Add related transactions, registered on the account like the
+        # transaction service does
+        t1 = MagicMock(account=account)
+        t2 = MagicMock(account=account)
+        other = MagicMock(account=MagicMock(account_name="Other"))
+        account.transactions.extend([t1, t2])
+        account_service.money_manager.transactions = [t1, t2, other]
 
         account_service.delete_account("Checking")
 
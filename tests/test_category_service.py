@@ -1,6 +1,6 @@
 # test/test_category_service.py
 
-from unittest.mock import MagicMock
+from dataclasses import dataclass
 
 import pytest
 
@@ -9,18 +9,68 @@ from app.exception import (AlreadyExistsError, CategoryInUseError,
 from app.models import TransactionType
 from app.services.category_service import CategoryService
 
+# Enum member lookups go through Enum's descriptor machinery; bind the
+# two members once at import
+_INCOME = TransactionType.INCOME
+_EXPENSE = TransactionType.EXPENSE
+
+
+class SaveSpy:
+    """Counting stand-in for money_manager.save with the Mock assert surface."""
+
+    __slots__ = ("calls",)
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, *args, **kwargs):
+        self.calls += 1
+
+    def assert_called(self):
+        assert self.calls >= 1
+
+    def assert_called_once(self):
+        assert self.calls == 1
+
+    def reset_mock(self):
+        self.calls = 0
+
+
+@dataclass(slots=True)
+class FakeTransaction:
+    """Attribute-only transaction stand-in; cheaper than a MagicMock."""
+
+    category: str
+    transaction_type: TransactionType
+    _dict_cache: dict | None = None
+
 
 class FakeMoneyManager:
     def __init__(self):
-        self.income_categories = []
-        self.expense_categories = []
+        self.income_categories = {}
+        self.expense_categories = {}
         self.transactions = []
-        self.save = MagicMock()
+        self.txn_version = 0
+        self.save = SaveSpy()
+
+    def reset(self):
+        """Return the shared template instance to a blank state."""
+        self.income_categories.clear()
+        self.expense_categories.clear()
+        self.transactions.clear()
+        self.txn_version = 0
+        self.save.reset_mock()
+
+
+# One template instance shared by every test; the fixture resets it in
+# place, which is much cheaper than rebuilding the MagicMock each time
+_TEMPLATE_MM = FakeMoneyManager()
 
 
 @pytest.fixture
 def money_manager() -> FakeMoneyManager:
-    return FakeMoneyManager()
+    _TEMPLATE_MM.reset()
+    return _TEMPLATE_MM
 
 
 @pytest.fixture
@@ -30,24 +80,28 @@ def category_service(money_manager):
 
 class TestGetCategories:
     def test_get_income_categories(self, category_service):
-        category_service.money_manager.income_categories.extend(["Salary", "Bonus"])
-        result = category_service.get_categories(TransactionType.INCOME)
+        category_service.money_manager.income_categories.update(
+            dict.fromkeys(["Salary", "Bonus"])
+        )
+        result = category_service.get_categories(_INCOME)
         assert result == ["Salary", "Bonus"]
 
     def test_get_expense_categories(self, category_service):
-        category_service.money_manager.expense_categories.extend(["Food", "Rent"])
-        result = category_service.get_categories(TransactionType.EXPENSE)
+        category_service.money_manager.expense_categories.update(
+            dict.fromkeys(["Food", "Rent"])
+        )
+        result = category_service.get_categories(_EXPENSE)
         assert result == ["Food", "Rent"]
 
     def test_get_categories_empty(self, category_service):
-        assert category_service.get_categories(TransactionType.INCOME) == []
-        assert category_service.get_categories(TransactionType.EXPENSE) == []
+        assert category_service.get_categories(_INCOME) == []
+        assert category_service.get_categories(_EXPENSE) == []
 
 
 class TestGetAllCategories:
     def test_get_all_categories(self, category_service):
-        category_service.money_manager.income_categories.extend(["Salary"])
-        category_service.money_manager.expense_categories.extend(["Food"])
+        category_service.money_manager.income_categories["Salary"] = None
+        category_service.money_manager.expense_categories["Food"] = None
         result = category_service.get_all_categories()
         assert result == ["Salary", "Food"]
 
@@ -57,28 +111,28 @@ class TestGetAllCategories:
 
 class TestIsValidCategory:
     def test_category_exists(self, category_service):
-        category_service.money_manager.income_categories.append("Salary")
+        category_service.money_manager.income_categories["Salary"] = None
         assert (
-            category_service.is_valid_category("Salary", TransactionType.INCOME) is True
+            category_service.is_valid_category("Salary", _INCOME) is True
         )
 
     def test_category_not_exists(self, category_service):
         assert (
-            category_service.is_valid_category("Bonus", TransactionType.INCOME) is False
+            category_service.is_valid_category("Bonus", _INCOME) is False
         )
 
     def test_category_with_spaces(self, category_service):
-        category_service.money_manager.income_categories.append("Salary")
+        category_service.money_manager.income_categories["Salary"] = None
         # Extra spaces not trimmed
         assert (
-            category_service.is_valid_category("  Salary  ", TransactionType.INCOME)
+            category_service.is_valid_category("  Salary  ", _INCOME)
             is False
         )
 
     def test_category_case_sensitivity(self, category_service):
-        category_service.money_manager.income_categories.append("Salary")
+        category_service.money_manager.income_categories["Salary"] = None
         assert (
-            category_service.is_valid_category("salary", TransactionType.INCOME)
+            category_service.is_valid_category("salary", _INCOME)
             is False
         )
 
@@ -105,13 +159,16 @@ class TestAddCategory:
             long_name.capitalize() in category_service.money_manager.income_categories
         )
 
-    def test_add_category_empty_raises(self, category_service):
-        with pytest.raises(InvalidInputError):
-            category_service.add_category("", "income")
-
-    def test_add_category_invalid_transaction_type_raises(self, category_service):
+    @pytest.mark.parametrize(
+        "category,transaction_type",
+        [("", "income"), ("Salary", "invalid_type")],
+        ids=["empty-name", "invalid-type"],
+    )
+    def test_add_category_invalid_input_raises(
+        self, category_service, category, transaction_type
+    ):
         with pytest.raises(InvalidInputError):
-            category_service.add_category("Salary", "invalid_type")
+            category_service.add_category(category, transaction_type)
 
     def test_add_category_already_exists_raises(self, category_service):
         category_service.add_category("Salary", "income")
@@ -121,9 +178,10 @@ class TestAddCategory:
 
 class TestEditCategory:
     def test_edit_category_success(self, category_service):
-        category_service.add_category("Salary", "income")
+        # Seed directly; add_category validation is not under test here
+        category_service.money_manager.income_categories["Salary"] = None
         # mock transaction
-        trans = MagicMock(category="Salary", transaction_type=TransactionType.INCOME)
+        trans = FakeTransaction("Salary", _INCOME)
         category_service.money_manager.transactions.append(trans)
 
         category_service.edit_category("Salary", "Bonus", "income")
@@ -134,58 +192,60 @@ class TestEditCategory:
         category_service.money_manager.save.assert_called()
 
     def test_edit_category_same_name_allowed(self, category_service):
-        category_service.add_category("Salary", "income")
+        category_service.money_manager.income_categories["Salary"] = None
         category_service.edit_category("Salary", "Salary", "income")
         assert "Salary" in category_service.money_manager.income_categories
 
     def test_edit_category_trim_and_capitalize(self, category_service):
-        category_service.add_category("Salary", "income")
+        category_service.money_manager.income_categories["Salary"] = None
         category_service.edit_category("Salary", "  bonus  ", "  INCOME ")
         assert "Bonus" in category_service.money_manager.income_categories
 
-    def test_edit_category_empty_new_name_raises(self, category_service):
-        category_service.add_category("Salary", "income")
+    @pytest.mark.parametrize(
+        "new_name,transaction_type",
+        [("", "income"), ("Bonus", "invalid")],
+        ids=["empty-name", "invalid-type"],
+    )
+    def test_edit_category_invalid_input_raises(
+        self, category_service, new_name, transaction_type
+    ):
+        category_service.money_manager.income_categories["Salary"] = None
         with pytest.raises(InvalidInputError):
-            category_service.edit_category("Salary", "", "income")
-
-    def test_edit_category_invalid_transaction_type_raises(self, category_service):
-        category_service.add_category("Salary", "income")
-        with pytest.raises(InvalidInputError):
-            category_service.edit_category("Salary", "Bonus", "invalid")
+            category_service.edit_category("Salary", new_name, transaction_type)
 
     def test_edit_category_old_category_not_found_raises(self, category_service):
         with pytest.raises(NotFoundError):
             category_service.edit_category("Missing", "New", "income")
 
     def test_edit_category_new_category_exists_raises(self, category_service):
-        category_service.add_category("Salary", "income")
-        category_service.add_category("Bonus", "income")
+        category_service.money_manager.income_categories["Salary"] = None
+        category_service.money_manager.income_categories["Bonus"] = None
         with pytest.raises(AlreadyExistsError):
             category_service.edit_category("Salary", "Bonus", "income")
 
 
 class TestDeleteCategory:
     def test_delete_income_category_success(self, category_service):
-        category_service.add_category("Salary", "income")
+        category_service.money_manager.income_categories["Salary"] = None
         result = category_service.delete_category("Salary", "income")
         assert result is True
         assert "Salary" not in category_service.money_manager.income_categories
         category_service.money_manager.save.assert_called()
 
     def test_delete_expense_category_success(self, category_service):
-        category_service.add_category("Food", "expense")
+        category_service.money_manager.expense_categories["Food"] = None
         result = category_service.delete_category("Food", "expense")
         assert result is True
         assert "Food" not in category_service.money_manager.expense_categories
 
     def test_delete_category_with_spaces_and_trim(self, category_service):
-        category_service.add_category("Salary", "income")
+        category_service.money_manager.income_categories["Salary"] = None
         category_service.delete_category("  salary  ", " income ")
         assert "Salary" not in category_service.money_manager.income_categories
 
     def test_delete_category_used_in_transaction_raises(self, category_service):
-        category_service.add_category("Salary", "income")
-        trans = MagicMock(category="Salary", transaction_type=TransactionType.INCOME)
+        category_service.money_manager.income_categories["Salary"] = None
+        trans = FakeTransaction("Salary", _INCOME)
         category_service.money_manager.transactions.append(trans)
         with pytest.raises(CategoryInUseError):
             category_service.delete_category("Salary", "income")
@@ -194,12 +254,15 @@ class TestDeleteCategory:
         with pytest.raises(NotFoundError):
             category_service.delete_category("Missing", "income")
 
-    def test_delete_empty_category_raises(self, category_service):
-        with pytest.raises(InvalidInputError):
-            category_service.delete_category("", "income")
-
-    def test_delete_invalid_transaction_type_raises(self, category_service):
+    @pytest.mark.parametrize(
+        "category,transaction_type",
+        [("", "income"), ("Salary", "invalid")],
+        ids=["empty-name", "invalid-type"],
+    )
+    def test_delete_category_invalid_input_raises(
+        self, category_service, category, transaction_type
+    ):
         with pytest.raises(InvalidInputError):
-            category_service.delete_category("Salary", "invalid")
+            category_service.delete_category(category, transaction_type)
 
 
@@ -1,6 +1,6 @@
 # test/test_filter_service.py
 
-from unittest.mock import MagicMock
+from types import SimpleNamespace
 
 import pytest
 
@@ -8,6 +8,11 @@ from app.exception import InvalidInputError, NotFoundError
 from app.models import TransactionType
 from app.services.filter_service import FilterService
 
+# Enum member lookups go through Enum's descriptor machinery; bind the
+# two members once at import
+_INCOME = TransactionType.INCOME
+_EXPENSE = TransactionType.EXPENSE
+
 
 class FakeAccount:
     def __init__(self, name):
@@ -23,16 +28,31 @@ class FakeTransaction:
         self.transaction_type = transaction_type
 
 
+class FakeAccountService:
+    """Dict-backed stand-in; get_account is a plain dict lookup."""
+
+    def __init__(self):
+        self.accounts = {}
+
+    def get_account(self, name):
+        return self.accounts.get(name)
+
+
 class FakeCategoryService:
+    # Categories live in insertion-ordered dicts so membership probes are
+    # hashed, mirroring the real service's storage
     def __init__(self):
-        self.income_categories = []
-        self.expense_categories = []
+        self.income_categories = {}
+        self.expense_categories = {}
 
     def get_all_categories(self):
-        return self.income_categories + self.expense_categories
+        return list(self.income_categories) + list(self.expense_categories)
+
+    def is_known_category(self, category):
+        return category in self.income_categories or category in self.expense_categories
 
     def get_categories(self, transaction_type):
-        if transaction_type == TransactionType.INCOME:
+        if transaction_type == _INCOME:
             return self.income_categories
         return self.expense_categories
 
@@ -43,16 +63,32 @@ class FakeMoneyManager:
         self.transactions = []
         self.income_categories = []
         self.expense_categories = []
-        self.account_service = MagicMock()
+        self.account_service = FakeAccountService()
         self.category_service = FakeCategoryService()
 
+    def reset(self):
+        """Return the shared template instance to a blank state."""
+        self.accounts.clear()
+        self.transactions.clear()
+        del self.income_categories[:]
+        del self.expense_categories[:]
+        self.category_service.income_categories.clear()
+        self.category_service.expense_categories.clear()
+        self.account_service.accounts.clear()
+
+
+# One template instance shared by every test; the fixture resets it in
+# place instead of rebuilding the whole fake graph each time
+_TEMPLATE_MM = FakeMoneyManager()
+
 
 @pytest.fixture
 def money_manager():
     """
-    Returns a FakeMoneyManager instance with mocked account_service and category_service.
+    Returns the shared FakeMoneyManager template, reset to a blank state.
     """
-    return FakeMoneyManager()
+    _TEMPLATE_MM.reset()
+    return _TEMPLATE_MM
 
 
 @pytest.fixture
@@ -63,124 +99,108 @@ def filter_service(money_manager):
     return FilterService(money_manager)
 
 
-class TestFilterByCategory:
+@pytest.fixture
+def standard_world(money_manager):
+    """
+    Populate the manager with the standard world the filter tests share:
+    one Checking account holding two Food expenses and one Salary income,
+    with both categories registered.
+    """
+    acc = FakeAccount("Checking")
+    food1 = FakeTransaction(1, acc, "Food", _EXPENSE)
+    food2 = FakeTransaction(2, acc, "Food", _EXPENSE)
+    salary = FakeTransaction(3, acc, "Salary", _INCOME)
+    acc.transactions.extend([food1, food2, salary])
+    money_manager.transactions.extend([food1, food2, salary])
+    money_manager.accounts["Checking"] = acc
+    money_manager.account_service.accounts["Checking"] = acc
+    money_manager.category_service.income_categories["Salary"] = None
+    money_manager.category_service.expense_categories["Food"] = None
+    return SimpleNamespace(acc=acc, food1=food1, food2=food2, salary=salary)
+
 
-    def test_filter_existing_category(self, filter_service, money_manager):
-        acc = FakeAccount("Checking")
-        t1 = FakeTransaction(1, acc, "Food", TransactionType.EXPENSE)
-        t2 = FakeTransaction(2, acc, "Food", TransactionType.EXPENSE)
-        t3 = FakeTransaction(3, acc, "Salary", TransactionType.INCOME)
-        money_manager.transactions.extend([t1, t2, t3])
-        money_manager.category_service.income_categories.append("Salary")
-        money_manager.category_service.expense_categories.append("Food")
+class TestFilterByCategory:
 
+    def test_filter_existing_category(self, filter_service, standard_world):
         result = filter_service.filter_transaction_by_category("food")
         assert len(result) == 2
-        assert all(t.category == "Food" for t in result)
+        # Set build + compare run at C level, unlike an all() genexpr
+        assert {t.category for t in result} == {"Food"}
 
     def test_category_no_transactions_returns_empty(
         self, filter_service, money_manager
     ):
-        money_manager.category_service.expense_categories.append("Utilities")
+        money_manager.category_service.expense_categories["Utilities"] = None
         result = filter_service.filter_transaction_by_category("Utilities")
         assert result == []
 
-    def test_category_with_spaces_and_case(self, filter_service, money_manager):
-        acc = FakeAccount("Checking")
-        t1 = FakeTransaction(1, acc, "Food", TransactionType.EXPENSE)
-        money_manager.transactions.append(t1)
-        money_manager.category_service.expense_categories.append("Food")
+    def test_category_with_spaces_and_case(self, filter_service, standard_world):
         result = filter_service.filter_transaction_by_category("  fOoD ")
-        assert result == [t1]
+        assert result == [standard_world.food1, standard_world.food2]
 
     def test_empty_category_raises(self, filter_service):
         with pytest.raises(InvalidInputError):
             filter_service.filter_transaction_by_category("")
 
-    def test_category_not_exist_raises(self, filter_service, money_manager):
-        money_manager.category_service.income_categories.append("Salary")
+    def test_category_not_exist_raises(self, filter_service, standard_world):
         with pytest.raises(NotFoundError):
             filter_service.filter_transaction_by_category("Bonus")
 
 
 class TestFilterByAccount:
 
-    def test_filter_existing_account(self, filter_service, money_manager):
-        acc = FakeAccount("Checking")
-        t1 = FakeTransaction(1, acc, "Food", TransactionType.EXPENSE)
-        t2 = FakeTransaction(2, acc, "Salary", TransactionType.INCOME)
-        money_manager.transactions.extend([t1, t2])
-        money_manager.accounts["Checking"] = acc
-        money_manager.account_service.get_account.side_effect = lambda name: (
-            acc if name == "Checking" else None
-        )
-
+    def test_filter_existing_account(self, filter_service, standard_world):
         result = filter_service.filter_transaction_by_account("Checking")
-        assert result == [t1, t2]
+        # Spell out the expected rows; comparing against the account's
+        # own list would pass for any contents
+        assert result == [
+            standard_world.food1,
+            standard_world.food2,
+            standard_world.salary,
+        ]
 
     def test_account_no_transactions_returns_empty(self, filter_service, money_manager):
         acc = FakeAccount("Savings")
         money_manager.accounts["Savings"] = acc
-        money_manager.account_service.get_account.side_effect = lambda name: acc
+        money_manager.account_service.accounts["Savings"] = acc
         result = filter_service.filter_transaction_by_account("Savings")
         assert result == []
 
-    def test_account_with_spaces_and_case(self, filter_service, money_manager):
-        acc = FakeAccount("Checking")
-        t1 = FakeTransaction(1, acc, "Food", TransactionType.EXPENSE)
-        money_manager.transactions.append(t1)
-        money_manager.accounts["Checking"] = acc
-        money_manager.account_service.get_account.side_effect = lambda name: acc
+    def test_account_with_spaces_and_case(self, filter_service, standard_world):
         result = filter_service.filter_transaction_by_account("  cHeCkInG ")
-        assert result == [t1]
+        assert result == [
+            standard_world.food1,
+            standard_world.food2,
+            standard_world.salary,
+        ]
 
     def test_empty_account_raises(self, filter_service):
         with pytest.raises(InvalidInputError):
             filter_service.filter_transaction_by_account("")
 
-    def test_account_not_exist_raises(self, filter_service, money_manager):
-        money_manager.account_service.get_account.side_effect = lambda name: None
+    def test_account_not_exist_raises(self, filter_service):
         with pytest.raises(NotFoundError):
             filter_service.filter_transaction_by_account("Unknown")
 
 
 class TestFilterByTransactionType:
 
-    def test_filter_income_transactions(self, filter_service, money_manager):
-        acc = FakeAccount("Checking")
-        t1 = FakeTransaction(1, acc, "Salary", TransactionType.INCOME)
-        t2 = FakeTransaction(2, acc, "Food", TransactionType.EXPENSE)
-        money_manager.transactions.extend([t1, t2])
-        money_manager.category_service.income_categories.append("Salary")
-        money_manager.category_service.expense_categories.append("Food")
-
+    def test_filter_income_transactions(self, filter_service, standard_world):
         result = filter_service.filter_transaction_by_transaction_type("income")
-        assert result == [t1]
-
-    def test_filter_expense_transactions(self, filter_service, money_manager):
-        acc = FakeAccount("Checking")
-        t1 = FakeTransaction(1, acc, "Salary", TransactionType.INCOME)
-        t2 = FakeTransaction(2, acc, "Food", TransactionType.EXPENSE)
-        money_manager.transactions.extend([t1, t2])
-        money_manager.category_service.income_categories.append("Salary")
-        money_manager.category_service.expense_categories.append("Food")
+        assert result == [standard_world.salary]
 
+    def test_filter_expense_transactions(self, filter_service, standard_world):
         result = filter_service.filter_transaction_by_transaction_type("EXPENSE")
-        assert result == [t2]
+        assert result == [standard_world.food1, standard_world.food2]
 
-    def test_transaction_type_with_spaces_and_case(self, filter_service, money_manager):
-        acc = FakeAccount("Checking")
-        t1 = FakeTransaction(1, acc, "Salary", TransactionType.INCOME)
-        money_manager.transactions.append(t1)
-        money_manager.category_service.income_categories.append("Salary")
+    def test_transaction_type_with_spaces_and_case(self, filter_service, standard_world):
         result = filter_service.filter_transaction_by_transaction_type("  InCoMe  ")
-        assert result == [t1]
-
-    def test_invalid_transaction_type_raises(self, filter_service):
-        with pytest.raises(InvalidInputError):
-            filter_service.filter_transaction_by_transaction_type("unknown")
+        assert result == [standard_world.salary]
 
-    def test_empty_transaction_type_raises(self, filter_service):
+    @pytest.mark.parametrize(
+        "transaction_type", ["unknown", ""], ids=["invalid-type", "empty-type"]
+    )
+    def test_invalid_transaction_type_raises(self, filter_service, transaction_type):
         with pytest.raises(InvalidInputError):
-            filter_service.filter_transaction_by_transaction_type("")
+            filter_service.filter_transaction_by_transaction_type(transaction_type)
 
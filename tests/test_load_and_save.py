@@ -9,6 +9,16 @@ import pytest
 from app.models import Account, Transaction, TransactionType
 from app.money_manager import MoneyManager
 
+# Enum member lookups go through Enum's descriptor machinery; bind the
+# two members once at import
+_INCOME = TransactionType.INCOME
+_EXPENSE = TransactionType.EXPENSE
+
+# Constants the round-trip test uses, built once at import
+_JAN1_NOON = datetime(2025, 1, 1, 12, 0, 0)
+_D50 = Decimal("50.00")
+_D500 = Decimal("500.00")
+
 
 @pytest.fixture
 def money_manager(tmp_path):
@@ -31,8 +41,8 @@ def test_save_and_load_data(money_manager):
 
     t = Transaction(
         transaction_id=1,
-        datetime=datetime(2025, 1, 1, 12, 0, 0),
-        transaction_type=TransactionType.EXPENSE,
+        datetime=_JAN1_NOON,
+        transaction_type=_EXPENSE,
         category="Food",
         account=acc,
         amount="50.00",
@@ -63,13 +73,54 @@ def test_save_and_load_data(money_manager):
     # Verify data was restored correctly
     assert "Wallet" in new_manager.accounts
     loaded_acc = new_manager.accounts["Wallet"]
-    assert Decimal(loaded_acc.balance) == Decimal("500.00")
+    assert Decimal(loaded_acc.balance) == _D500
 
     assert len(new_manager.transactions) == 1
     loaded_trans = new_manager.transactions[0]
 
     assert loaded_trans.transaction_id == 1
     assert loaded_trans.category == "Food"
-    assert loaded_trans.amount == Decimal("50.00")
-    assert loaded_trans.transaction_type == TransactionType.EXPENSE
+    assert loaded_trans.amount == _D50
+    assert loaded_trans.transaction_type == _EXPENSE
     assert loaded_trans.account.account_name == "Wallet"
+
+
+def test_batch_coalesces_saves(money_manager):
+    manager, _ = money_manager
+
+    writes = []
+    manager._save_data = lambda: writes.append(1)
+
+    with manager.batch():
+        manager.save()
+        manager.save()
+    assert len(writes) == 1
+
+    # Outside a batch, save() writes immediately again
+    manager.save()
+    assert len(writes) == 2
+
+
+def test_batch_without_saves_writes_nothing(money_manager):
+    manager, _ = money_manager
+
+    writes = []
+    manager._save_data = lambda: writes.append(1)
+
+    with manager.batch():
+        pass
+    assert writes == []
+
+
+def test_nested_batches_write_once_at_outermost_exit(money_manager):
+    manager, _ = money_manager
+
+    writes = []
+    manager._save_data = lambda: writes.append(1)
+
+    with manager.batch():
+        with manager.batch():
+            manager.save()
+        # Inner exit must not write yet
+        assert writes == []
+    assert len(writes) == 1
@@ -9,6 +9,39 @@ import pytest
 from app.models import TransactionType
 from app.services.summary_service import SummaryService
 
+# Enum member lookups go through Enum's descriptor machinery; bind the
+# two members once at import
+_INCOME = TransactionType.INCOME
+_EXPENSE = TransactionType.EXPENSE
+
+
+# The fixed dates the suite asserts against, constructed once at import
+_OCT1 = datetime(2025, 10, 1)
+_OCT5 = datetime(2025, 10, 5)
+_OCT6 = datetime(2025, 10, 6)
+_OCT10 = datetime(2025, 10, 10)
+_OCT27 = datetime(2025, 10, 27)
+_OCT27_END = datetime(2025, 10, 27, 23, 59, 59)
+_OCT28 = datetime(2025, 10, 28)
+_OCT28_END = datetime(2025, 10, 28, 23, 59, 59)
+_OCT31 = datetime(2025, 10, 31)
+_OCT31_2359 = datetime(2025, 10, 31, 23, 59)
+_NOV1 = datetime(2025, 11, 1)
+
+# Decimal parsing from a string is a per-digit pure-Python path; the
+# handful of amounts the suite uses are built once at import
+_D0 = Decimal("0.00")
+_D3 = Decimal("3.00")
+_D5 = Decimal("5.00")
+_D10 = Decimal("10.00")
+_D20 = Decimal("20.00")
+_D30 = Decimal("30.00")
+_D50 = Decimal("50.00")
+_D80 = Decimal("80.00")
+_D100 = Decimal("100.00")
+_D150 = Decimal("150.00")
+_D200 = Decimal("200.00")
+
 
 class FakeAccount:
     def __init__(self, name):
@@ -24,7 +57,8 @@ class FakeTransaction:
         self.account = account
         self.category = category
         self.transaction_type = transaction_type
-        self.amount = Decimal(amount)
+        self.amount = amount
+        self.amount_cents = int(self.amount.scaleb(2))
         self.datetime = datetime_obj
 
 
@@ -43,10 +77,67 @@ class FakeMoneyManager:
         self.account_service = MagicMock()
         self.category_service = FakeCategoryService()
 
+    def reset(self):
+        """Return the shared template instance to a blank state."""
+        self.accounts.clear()
+        self.transactions.clear()
+        del self.income_categories[:]
+        del self.expense_categories[:]
+        del self.category_service.income_categories[:]
+        del self.category_service.expense_categories[:]
+        self.account_service.reset_mock(return_value=True, side_effect=True)
+
+
+# One template instance shared by every test; the fixture resets it in
+# place, which is much cheaper than rebuilding the MagicMock each time
+_TEMPLATE_MM = FakeMoneyManager()
+
+# Shared read-only October 2025 world, built once per module. The summary
+# service only reads transactions, so tests extend the manager with these
+# shared instances instead of reconstructing the same graph per test.
+_ACC = FakeAccount("Checking")
+_MONTHLY_TXS = (
+    FakeTransaction(
+        1, _ACC, "Salary", _INCOME, _D200, _OCT1
+    ),
+    FakeTransaction(
+        2, _ACC, "Food", _EXPENSE, _D50, _OCT31_2359
+    ),
+    FakeTransaction(
+        3, _ACC, "Other", _EXPENSE, _D30, _NOV1
+    ),
+)
+_EXPENSE_TXS = (
+    FakeTransaction(
+        1, _ACC, "Food", _EXPENSE, _D50, _OCT5
+    ),
+    FakeTransaction(
+        2, _ACC, "Transport", _EXPENSE, _D20, _OCT6
+    ),
+    FakeTransaction(
+        3, _ACC, "Food", _EXPENSE, _D30, _OCT10
+    ),
+    FakeTransaction(
+        4, _ACC, "Salary", _INCOME, _D100, _OCT5
+    ),
+)
+_INCOME_TXS = (
+    FakeTransaction(
+        1, _ACC, "Salary", _INCOME, _D100, _OCT5
+    ),
+    FakeTransaction(
+        2, _ACC, "Bonus", _INCOME, _D50, _OCT10
+    ),
+    FakeTransaction(
+        3, _ACC, "Food", _EXPENSE, _D20, _OCT10
+    ),
+)
+
 
 @pytest.fixture
 def money_manager():
-    return FakeMoneyManager()
+    _TEMPLATE_MM.reset()
+    return _TEMPLATE_MM
 
 
 @pytest.fixture
@@ -54,6 +145,13 @@ def summary_service(money_manager):
     return SummaryService(money_manager)
 
 
+# The empty-path tests never touch the manager, so one service over one
+# untouched manager serves them all without per-test reset work
+@pytest.fixture(scope="module")
+def empty_summary_service():
+    return SummaryService(FakeMoneyManager())
+
+
 class TestDailySummary:
 
     def test_transactions_exist(self, summary_service, money_manager):
@@ -61,19 +159,19 @@ class TestDailySummary:
         money_manager.accounts["Checking"] = acc
 
         now = datetime.now()
-        t1 = FakeTransaction(1, acc, "Salary", TransactionType.INCOME, "100.00", now)
-        t2 = FakeTransaction(2, acc, "Food", TransactionType.EXPENSE, "50.00", now)
+        t1 = FakeTransaction(1, acc, "Salary", _INCOME, _D100, now)
+        t2 = FakeTransaction(2, acc, "Food", _EXPENSE, _D50, now)
         money_manager.transactions.extend([t1, t2])
 
         result = summary_service.get_daily_summary(now)
-        assert result["total_income"] == Decimal("100.00")
-        assert result["total_expense"] == Decimal("50.00")
-        assert result["net"] == Decimal("50.00")
+        assert result["total_income"] == _D100
+        assert result["total_expense"] == _D50
+        assert result["net"] == _D50
         assert result["transaction_count"] == 2
 
-    def test_no_transactions_returns_zero(self, summary_service):
+    def test_no_transactions_returns_zero(self, empty_summary_service):
         now = datetime.now()
-        result = summary_service.get_daily_summary(now)
+        result = empty_summary_service.get_daily_summary(now)
         assert result["total_income"] == 0
         assert result["total_expense"] == 0
         assert result["net"] == 0
@@ -82,37 +180,37 @@ class TestDailySummary:
     def test_boundary_times_included(self, summary_service, money_manager):
         acc = FakeAccount("Checking")
         money_manager.accounts["Checking"] = acc
-        date = datetime(2025, 10, 28)
+        date = _OCT28
 
         t1 = FakeTransaction(
             1,
             acc,
             "Salary",
-            TransactionType.INCOME,
-            "10.00",
-            datetime(2025, 10, 28, 0, 0, 0),
+            _INCOME,
+            _D10,
+            _OCT28,
         )
         t2 = FakeTransaction(
             2,
             acc,
             "Food",
-            TransactionType.EXPENSE,
-            "5.00",
-            datetime(2025, 10, 28, 23, 59, 59),
+            _EXPENSE,
+            _D5,
+            _OCT28_END,
         )
         t3 = FakeTransaction(
             3,
             acc,
             "Other",
-            TransactionType.EXPENSE,
-            "3.00",
-            datetime(2025, 10, 27, 23, 59, 59),
+            _EXPENSE,
+            _D3,
+            _OCT27_END,
         )
         money_manager.transactions.extend([t1, t2, t3])
 
         result = summary_service.get_daily_summary(date)
-        assert result["total_income"] == Decimal("10.00")
-        assert result["total_expense"] == Decimal("5.00")
+        assert result["total_income"] == _D10
+        assert result["total_expense"] == _D5
         assert result["transaction_count"] == 2
 
 
@@ -123,14 +221,14 @@ class TestWeeklySummary:
         money_manager.accounts["Checking"] = acc
 
         # Monday of the week
-        monday = datetime(2025, 10, 27)
-        t1 = FakeTransaction(1, acc, "Salary", TransactionType.INCOME, "100.00", monday)
+        monday = _OCT27
+        t1 = FakeTransaction(1, acc, "Salary", _INCOME, _D100, monday)
         t2 = FakeTransaction(
             2,
             acc,
             "Food",
-            TransactionType.EXPENSE,
-            "50.00",
+            _EXPENSE,
+            _D50,
             monday + timedelta(days=6, hours=23),
         )
         # Outside current week
@@ -138,21 +236,21 @@ class TestWeeklySummary:
             3,
             acc,
             "Other",
-            TransactionType.EXPENSE,
-            "20.00",
+            _EXPENSE,
+            _D20,
             monday - timedelta(days=1),
         )
         money_manager.transactions.extend([t1, t2, t3])
 
         result = summary_service.get_weekly_summary(monday)
-        assert result["total_income"] == Decimal("100.00")
-        assert result["total_expense"] == Decimal("50.00")
-        assert result["net"] == Decimal("50.00")
+        assert result["total_income"] == _D100
+        assert result["total_expense"] == _D50
+        assert result["net"] == _D50
         assert result["transaction_count"] == 2
 
-    def test_no_transactions_weekly(self, summary_service):
-        date = datetime(2025, 10, 27)
-        result = summary_service.get_weekly_summary(date)
+    def test_no_transactions_weekly(self, empty_summary_service):
+        date = _OCT27
+        result = empty_summary_service.get_weekly_summary(date)
         assert result["total_income"] == 0
         assert result["total_expense"] == 0
         assert result["net"] == 0
@@ -162,99 +260,64 @@ class TestWeeklySummary:
 class TestMonthlySummary:
 
     def test_monthly_summary_totals(self, summary_service, money_manager):
-        acc = FakeAccount("Checking")
-        money_manager.accounts["Checking"] = acc
+        money_manager.accounts["Checking"] = _ACC
 
-        # October 2025
-        t1 = FakeTransaction(
-            1,
-            acc,
-            "Salary",
-            TransactionType.INCOME,
-            "200.00",
-            datetime(2025, 10, 1, 0, 0),
-        )
-        t2 = FakeTransaction(
-            2,
-            acc,
-            "Food",
-            TransactionType.EXPENSE,
-            "50.00",
-            datetime(2025, 10, 31, 23, 59),
-        )
-        t3 = FakeTransaction(
-            3, acc, "Other", TransactionType.EXPENSE, "30.00", datetime(2025, 11, 1)
-        )
-        money_manager.transactions.extend([t1, t2, t3])
+        # October 2025 (plus one November row that must be excluded)
+        money_manager.transactions.extend(_MONTHLY_TXS)
 
         result = summary_service.get_monthly_summary(2025, 10)
-        assert result["total_income"] == Decimal("200.00")
-        assert result["total_expense"] == Decimal("50.00")
-        assert result["net"] == Decimal("150.00")
+        assert result["total_income"] == _D200
+        assert result["total_expense"] == _D50
+        assert result["net"] == _D150
         assert result["transaction_count"] == 2
 
-    def test_invalid_month_or_year_returns_empty(self, summary_service):
-        assert summary_service.get_monthly_summary(0, 5) == {}
-        assert summary_service.get_monthly_summary(2025, 0) == {}
-        assert summary_service.get_monthly_summary(2025, 13) == {}
+    def test_invalid_month_or_year_returns_empty(self, empty_summary_service):
+        assert empty_summary_service.get_monthly_summary(0, 5) == {}
+        assert empty_summary_service.get_monthly_summary(2025, 0) == {}
+        assert empty_summary_service.get_monthly_summary(2025, 13) == {}
 
 
 class TestExpensesByCategory:
 
     def test_expenses_by_category(self, summary_service, money_manager):
-        acc = FakeAccount("Checking")
-        money_manager.accounts["Checking"] = acc
+        money_manager.accounts["Checking"] = _ACC
 
-        start = datetime(2025, 10, 1)
-        end = datetime(2025, 10, 31)
+        start = _OCT1
+        end = _OCT31
 
-        t1 = FakeTransaction(
-            1, acc, "Food", TransactionType.EXPENSE, "50.00", datetime(2025, 10, 5)
-        )
-        t2 = FakeTransaction(
-            2, acc, "Transport", TransactionType.EXPENSE, "20.00", datetime(2025, 10, 6)
-        )
-        t3 = FakeTransaction(
-            3, acc, "Food", TransactionType.EXPENSE, "30.00", datetime(2025, 10, 10)
-        )
-        t4 = FakeTransaction(
-            4, acc, "Salary", TransactionType.INCOME, "100.00", datetime(2025, 10, 5)
-        )
-        money_manager.transactions.extend([t1, t2, t3, t4])
+        money_manager.transactions.extend(_EXPENSE_TXS)
 
-        result = summary_service.get_expenses_by_category(start, end)
-        assert result == {"Food": Decimal("80.00"), "Transport": Decimal("20.00")}
+        result, total = summary_service.get_expenses_by_category(start, end)
+        assert result == {"Food": _D80, "Transport": _D20}
+        assert total == _D100
 
-    def test_expenses_empty_or_invalid_range(self, summary_service):
-        start = datetime(2025, 10, 10)
-        end = datetime(2025, 10, 5)
-        assert summary_service.get_expenses_by_category(start, end) == {}
+    def test_expenses_empty_or_invalid_range(self, empty_summary_service):
+        start = _OCT10
+        end = _OCT5
+        assert empty_summary_service.get_expenses_by_category(start, end) == (
+            {},
+            _D0,
+        )
 
 
 class TestIncomeByCategory:
 
     def test_income_by_category(self, summary_service, money_manager):
-        acc = FakeAccount("Checking")
-        money_manager.accounts["Checking"] = acc
+        money_manager.accounts["Checking"] = _ACC
 
-        start = datetime(2025, 10, 1)
-        end = datetime(2025, 10, 31)
+        start = _OCT1
+        end = _OCT31
 
-        t1 = FakeTransaction(
-            1, acc, "Salary", TransactionType.INCOME, "100.00", datetime(2025, 10, 5)
-        )
-        t2 = FakeTransaction(
-            2, acc, "Bonus", TransactionType.INCOME, "50.00", datetime(2025, 10, 10)
-        )
-        t3 = FakeTransaction(
-            3, acc, "Food", TransactionType.EXPENSE, "20.00", datetime(2025, 10, 10)
-        )
-        money_manager.transactions.extend([t1, t2, t3])
+        money_manager.transactions.extend(_INCOME_TXS)
 
-        result = summary_service.get_income_by_category(start, end)
-        assert result == {"Salary": Decimal("100.00"), "Bonus": Decimal("50.00")}
+        result, total = summary_service.get_income_by_category(start, end)
+        assert result == {"Salary": _D100, "Bonus": _D50}
+        assert total == _D150
 
-    def test_income_empty_or_invalid_range(self, summary_service):
-        start = datetime(2025, 10, 10)
-        end = datetime(2025, 10, 5)
-        assert summary_service.get_income_by_category(start, end) == {}
+    def test_income_empty_or_invalid_range(self, empty_summary_service):
+        start = _OCT10
+        end = _OCT5
+        assert empty_summary_service.get_income_by_category(start, end) == (
+            {},
+            _D0,
+        )
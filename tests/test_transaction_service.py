@@ -1,8 +1,9 @@
 # test/test_tramsactopm_service.py
 
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from decimal import Decimal
-from unittest.mock import MagicMock
+from types import SimpleNamespace
 
 import pytest
 
@@ -11,33 +12,79 @@ from app.models import TransactionType
 from app.services.transaction_service import TransactionService
 from app.utility import format_amount
 
+# Enum member lookups go through Enum's descriptor machinery; bind the
+# two members once at import
+_INCOME = TransactionType.INCOME
+_EXPENSE = TransactionType.EXPENSE
+
 
 class FakeAccount:
+    # The running balance stays a Decimal internally so each update is
+    # one arithmetic op instead of two string re-parses; the balance
+    # property stringifies only when something reads it
     def __init__(self, name, balance="0.00"):
         self.account_name = name
-        self.balance = balance
+        self._balance = Decimal(balance)
         self.transactions = []
 
+    @property
+    def balance(self):
+        return str(self._balance)
+
     def update_balance(self, amount, transaction_type):
-        self.balance = str(
-            Decimal(self.balance) + Decimal(amount)
-            if transaction_type == TransactionType.INCOME
-            else Decimal(self.balance) - Decimal(amount)
-        )
+        amount = amount if isinstance(amount, Decimal) else Decimal(amount)
+        if transaction_type == _INCOME:
+            self._balance += amount
+        else:
+            self._balance -= amount
 
     def reverse_balance(self, amount, transaction_type):
-        self.balance = str(
-            Decimal(self.balance) - Decimal(amount)
-            if transaction_type == TransactionType.INCOME
-            else Decimal(self.balance) + Decimal(amount)
-        )
+        amount = amount if isinstance(amount, Decimal) else Decimal(amount)
+        if transaction_type == _INCOME:
+            self._balance -= amount
+        else:
+            self._balance += amount
 
     def add_transaction(self, transaction):
         self.transactions.append(transaction)
 
     def remove_transaction(self, transaction):
-        if transaction in self.transactions:
+        # One list scan instead of a membership check followed by remove
+        try:
             self.transactions.remove(transaction)
+        except ValueError:
+            pass
+
+
+class FakeAccountService:
+    """Dict-backed stand-in; get_account is a plain dict lookup."""
+
+    def __init__(self):
+        self.accounts = {}
+
+    def get_account(self, name):
+        return self.accounts.get(name)
+
+
+class SaveSpy:
+    """Counting stand-in for money_manager.save with the Mock assert surface."""
+
+    __slots__ = ("call_count",)
+
+    def __init__(self):
+        self.call_count = 0
+
+    def __call__(self, *args, **kwargs):
+        self.call_count += 1
+
+    def assert_called(self):
+        assert self.call_count >= 1
+
+    def assert_not_called(self):
+        assert self.call_count == 0
+
+    def reset_mock(self):
+        self.call_count = 0
 
 
 class FakeCategoryService:
@@ -46,7 +93,7 @@ class FakeCategoryService:
         self.expense_categories = []
 
     def is_valid_category(self, category, transaction_type):
-        if transaction_type == TransactionType.INCOME:
+        if transaction_type == _INCOME:
             return category in self.income_categories
         return category in self.expense_categories
 
@@ -54,14 +101,36 @@ class FakeCategoryService:
 class FakeMoneyManager:
     def __init__(self):
         self.transactions = []
-        self.account_service = MagicMock()
+        self.txn_version = 0
+        self.account_service = FakeAccountService()
         self.category_service = FakeCategoryService()
-        self.save = MagicMock()
+        self.save = SaveSpy()
+
+    @contextmanager
+    def batch(self):
+        yield self
+
+    def reset(self):
+        """Return the shared template instance to a blank state."""
+        self.transactions.clear()
+        self.txn_version = 0
+        del self.category_service.income_categories[:]
+        del self.category_service.expense_categories[:]
+        self.account_service.accounts.clear()
+        self.save.reset_mock()
+
+
+# One template instance shared by every test; the fixture resets it in
+# place instead of rebuilding the whole fake graph each time.
+# TransactionService itself stays function-scoped so its lazy caches
+# never carry over between tests.
+_TEMPLATE_MM = FakeMoneyManager()
 
 
 @pytest.fixture
 def money_manager():
-    return FakeMoneyManager()
+    _TEMPLATE_MM.reset()
+    return _TEMPLATE_MM
 
 
 @pytest.fixture
@@ -73,14 +142,32 @@ def transaction_service(money_manager):
 def setup_accounts_and_categories(transaction_service, money_manager):
     acc1 = FakeAccount("Checking")
     acc2 = FakeAccount("Savings")
-    money_manager.account_service.get_account.side_effect = lambda name: (
-        acc1 if name == "Checking" else (acc2 if name == "Savings" else None)
+    money_manager.account_service.accounts.update(
+        {"Checking": acc1, "Savings": acc2}
     )
     money_manager.category_service.income_categories.append("Salary")
     money_manager.category_service.expense_categories.append("Food")
     return acc1, acc2
 
 
+@pytest.fixture
+def make_transaction(transaction_service, setup_accounts_and_categories):
+    """Factory for the standard income/Salary/Checking transaction most tests seed."""
+
+    def _make(
+        transaction_type="income",
+        category="Salary",
+        account_name="Checking",
+        amount="100",
+        description="desc",
+    ):
+        return transaction_service.add_transaction(
+            transaction_type, category, account_name, amount, description
+        )
+
+    return _make
+
+
 class TestNextTransactionID:
     def test_no_transactions_returns_1(self, transaction_service):
         assert transaction_service.next_transaction_id == 1
@@ -90,11 +177,13 @@ class TestNextTransactionID:
     ):
         acc1, _ = setup_accounts_and_categories
         for tid in [1, 3, 7]:
-            t = MagicMock(
+            # Only transaction_id is read; a namespace is a plain
+            # attribute bag without MagicMock's child-mock machinery
+            t = SimpleNamespace(
                 transaction_id=tid,
                 account=acc1,
                 amount="10.00",
-                transaction_type=TransactionType.INCOME,
+                transaction_type=_INCOME,
             )
             transaction_service.transactions.append(t)
         assert transaction_service.next_transaction_id == 8
@@ -112,12 +201,14 @@ class TestAddTransaction:
         assert trans.account == acc1
         assert acc1.transactions[-1] == trans
         transaction_service.money_manager.save.assert_called()
-        assert trans.transaction_type == TransactionType.INCOME
+        assert trans.transaction_type == _INCOME
         assert trans.category == "Salary"
         assert trans.amount == format_amount("100.00")
         assert trans.description == "Monthly salary"
         assert trans.transaction_id == 1
-        assert hasattr(trans, "datetime")
+        # hasattr would swallow a property raising AttributeError; check
+        # the value itself instead
+        assert isinstance(trans.datetime, datetime)
 
     def test_add_expense_transaction_success(
         self, transaction_service, setup_accounts_and_categories
@@ -130,68 +221,112 @@ class TestAddTransaction:
         assert trans.account == acc2
         assert trans.description == ""
 
-    def test_add_transaction_invalid_type_raises(
-        self, transaction_service, setup_accounts_and_categories
+    @pytest.mark.parametrize(
+        "transaction_type,category,account_name,amount,exc",
+        [
+            ("invalid", "Salary", "Checking", "100", InvalidInputError),
+            ("income", "Bonus", "Checking", "100", NotFoundError),
+            ("income", "Salary", "Unknown", "100", NotFoundError),
+            ("income", "Salary", "Checking", "-10", InvalidInputError),
+        ],
+        ids=["invalid-type", "unknown-category", "unknown-account", "negative-amount"],
+    )
+    def test_add_transaction_invalid_input_raises(
+        self,
+        transaction_service,
+        setup_accounts_and_categories,
+        transaction_type,
+        category,
+        account_name,
+        amount,
+        exc,
     ):
-        with pytest.raises(InvalidInputError):
+        with pytest.raises(exc):
             transaction_service.add_transaction(
-                "invalid", "Salary", "Checking", "100", "desc"
+                transaction_type, category, account_name, amount, "desc"
             )
 
-    def test_add_transaction_category_not_exist_raises(
-        self, transaction_service, setup_accounts_and_categories
-    ):
-        with pytest.raises(NotFoundError):
-            transaction_service.add_transaction(
-                "income", "Bonus", "Checking", "100", "desc"
-            )
 
-    def test_add_transaction_account_not_exist_raises(
+class TestBulkAdd:
+    def test_bulk_add_creates_all_rows_with_one_save(
         self, transaction_service, setup_accounts_and_categories
     ):
-        with pytest.raises(NotFoundError):
-            transaction_service.add_transaction(
-                "income", "Salary", "Unknown", "100", "desc"
-            )
-
-    def test_add_transaction_invalid_amount_raises(
+        acc1, acc2 = setup_accounts_and_categories
+        created = transaction_service.bulk_add(
+            [
+                {
+                    "transaction_type": "income",
+                    "category": "Salary",
+                    "account_name": "Checking",
+                    "amount": "100.00",
+                    "description": "pay",
+                },
+                {
+                    "transaction_type": "expense",
+                    "category": "Food",
+                    "account_name": "Savings",
+                    "amount": "25.00",
+                },
+            ]
+        )
+        assert [t.transaction_id for t in created] == [1, 2]
+        assert created[0].account == acc1
+        assert created[1].account == acc2
+        assert created[1].description == ""
+        assert transaction_service.transactions == created
+        assert transaction_service.money_manager.save.call_count == 1
+        assert transaction_service.next_transaction_id == 3
+
+    def test_bulk_add_invalid_row_leaves_nothing_behind(
         self, transaction_service, setup_accounts_and_categories
     ):
-        with pytest.raises(InvalidInputError):
-            transaction_service.add_transaction(
-                "income", "Salary", "Checking", "-10", "desc"
+        with pytest.raises(NotFoundError):
+            transaction_service.bulk_add(
+                [
+                    {
+                        "transaction_type": "income",
+                        "category": "Salary",
+                        "account_name": "Checking",
+                        "amount": "100.00",
+                    },
+                    {
+                        "transaction_type": "income",
+                        "category": "Bonus",
+                        "account_name": "Checking",
+                        "amount": "10.00",
+                    },
+                ]
             )
+        assert transaction_service.transactions == []
+        transaction_service.money_manager.save.assert_not_called()
 
 
 class TestGetTransaction:
-    def test_get_existing_transaction(
-        self, transaction_service, setup_accounts_and_categories
-    ):
-        acc1, _ = setup_accounts_and_categories
-        trans = transaction_service.add_transaction(
-            "income", "Salary", "Checking", "100", "desc"
-        )
+    def test_get_existing_transaction(self, transaction_service, make_transaction):
+        trans = make_transaction()
         assert transaction_service.get_transaction(trans.transaction_id) == trans
 
-    def test_get_nonexistent_transaction_returns_none(self, transaction_service):
-        assert transaction_service.get_transaction(999) is None
-        assert transaction_service.get_transaction(-5) is None
+    @pytest.mark.parametrize("transaction_id", [999, -5, 0])
+    def test_get_nonexistent_transaction_returns_none(
+        self, transaction_service, transaction_id
+    ):
+        assert transaction_service.get_transaction(transaction_id) is None
 
 
 class TestGetAllTransactions:
     def test_sorted_transactions_descending_and_ascending(
-        self, transaction_service, setup_accounts_and_categories
+        self, transaction_service, make_transaction, monkeypatch
     ):
-        acc1, _ = setup_accounts_and_categories
-        now = datetime.now()
-        t1 = transaction_service.add_transaction(
-            "income", "Salary", "Checking", "100", "t1"
+        # Deterministic strictly increasing clock: no real datetime.now()
+        # call and no manual timestamp fix-ups afterwards
+        base = datetime(2025, 1, 1)
+        ticks = iter(range(1, 100))
+        monkeypatch.setattr(
+            "app.services.transaction_service.get_current_time",
+            lambda: base + timedelta(seconds=next(ticks)),
         )
-        t2 = transaction_service.add_transaction(
-            "income", "Salary", "Checking", "50", "t2"
-        )
-        t1.datetime = now
-        t2.datetime = now + timedelta(seconds=10)
+        t1 = make_transaction(description="t1")
+        t2 = make_transaction(amount="50", description="t2")
 
         sorted_desc = transaction_service.get_all_transactions()
         assert sorted_desc[0] == t2
@@ -203,30 +338,54 @@ class TestGetAllTransactions:
         assert sorted_asc[0] == t1
         assert sorted_asc[1] == t2
 
+    def test_same_timestamp_keeps_insertion_order_both_directions(
+        self, transaction_service, make_transaction, monkeypatch
+    ):
+        # Timestamps truncate to whole seconds, so two adds in the same
+        # second are a routine tie; the stable sort must keep their
+        # insertion order in both views
+        monkeypatch.setattr(
+            "app.services.transaction_service.get_current_time",
+            lambda: datetime(2025, 1, 1, 12, 0, 0),
+        )
+        t1 = make_transaction(description="t1")
+        t2 = make_transaction(amount="50", description="t2")
+
+        assert transaction_service.get_all_transactions() == [t1, t2]
+        assert transaction_service.get_all_transactions(
+            reverse_chronological=False
+        ) == [t1, t2]
+
 
 class TestEditTransaction:
-    def test_edit_all_fields(self, transaction_service, setup_accounts_and_categories):
+    def test_edit_all_fields(
+        self, transaction_service, setup_accounts_and_categories, make_transaction
+    ):
         acc1, acc2 = setup_accounts_and_categories
-        trans = transaction_service.add_transaction(
-            "income", "Salary", "Checking", "100", "desc"
-        )
+        trans = make_transaction()
         edited = transaction_service.edit_transaction(
             trans.transaction_id, "expense", "food", "Savings", "50.00", "edited"
         )
-        assert edited.transaction_type == TransactionType.EXPENSE
+        assert edited.transaction_type == _EXPENSE
         assert edited.category == "Food"
         assert edited.account == acc2
         assert edited.amount == Decimal("50.00") or edited.amount == "50.00"
         assert edited.description == "edited"
         transaction_service.money_manager.save.assert_called()
 
-    def test_edit_partial_fields(
-        self, transaction_service, setup_accounts_and_categories
+    def test_edit_unchanged_values_skips_save(
+        self, transaction_service, make_transaction
     ):
-        acc1, _ = setup_accounts_and_categories
-        trans = transaction_service.add_transaction(
-            "income", "Salary", "Checking", "100", "desc"
+        trans = make_transaction()
+        transaction_service.money_manager.save.reset_mock()
+        edited = transaction_service.edit_transaction(
+            trans.transaction_id, "income", "salary", "Checking", "100", "desc"
         )
+        assert edited is trans
+        transaction_service.money_manager.save.assert_not_called()
+
+    def test_edit_partial_fields(self, transaction_service, make_transaction):
+        trans = make_transaction()
         edited = transaction_service.edit_transaction(
             trans.transaction_id, "", "", "", "200", ""
         )
@@ -236,12 +395,10 @@ class TestEditTransaction:
 
 class TestDeleteTransaction:
     def test_delete_existing_transaction(
-        self, transaction_service, setup_accounts_and_categories
+        self, transaction_service, setup_accounts_and_categories, make_transaction
     ):
         acc1, _ = setup_accounts_and_categories
-        trans = transaction_service.add_transaction(
-            "income", "Salary", "Checking", "100", "desc"
-        )
+        trans = make_transaction()
         result = transaction_service.delete_transaction(trans.transaction_id)
         assert result is True
         assert trans not in transaction_service.transactions